@@ -1,3 +1,11 @@
-from .test import funcTest
+import sys
 
-funcTest()
+if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+    from .bench import main
+    main(sys.argv[2:])
+elif len(sys.argv) > 1 and sys.argv[1] == 'serve':
+    from .server import main
+    main(sys.argv[2:])
+else:
+    from .test import funcTest
+    funcTest()
@@ -0,0 +1,236 @@
+'''Asyncio client for CPG SCPI
+
+AsyncCircuitPlayground is the asyncio counterpart of cpg_scpi.CircuitPlayground.
+All measurement methods are coroutines, e.g. await cpg.acc(), such that one event loop can drive many boards.
+
+Needs the optional package pyserial-asyncio: pip install pyserial-asyncio
+
+Example:
+
+    import asyncio
+    from cpg_scpi.aio import AsyncCircuitPlayground
+
+    async def main():
+        async with AsyncCircuitPlayground() as cpg:
+            print(await cpg.acc())
+            async for timestamp, x, y, z in cpg.stream('MEAS:ACC?', interval_ms=10, count=100):
+                print(timestamp, x, y, z)
+
+    asyncio.run(main())
+
+A stream holds the connection until it ends. If an endless stream is left with break, close it with
+await samples.aclose() (or contextlib.aclosing() on Python 3.10+) before the next command, see stream().
+'''
+
+import asyncio
+import sys
+from typing import AsyncIterator, List
+
+from . import CircuitPlayground, CpgResponseError, CpgTimeoutError, _MEASUREMENTS, _MEASUREMENTS_BY_CMD, _MEASUREMENTS_BY_NAME, _addMethod, _encode
+
+
+class AsyncCircuitPlayground:
+    '''Class to communicate with an Adafruit Circuit Playground via a serial com port and the SCPI protocol using asyncio
+
+    Errors are raised as CpgResponseError and CpgTimeoutError like in CircuitPlayground, with the timeout applying to
+    each response line. Unlike CircuitPlayground, there is no detection of a lost board and no automatic reconnect:
+    after the board was unplugged, the serial errors are raised as they are, and the caller has to close() and connect() again.
+    '''
+
+    def __init__(self, comport = 'auto', baudrate = 115200, timeout: float = 5, portCache = False) -> None:
+        '''Create an AsyncCircuitPlayground object. Call connect() or use "async with" to connect to the CircuitPlayground.
+        portCache=True uses or prefers the board remembered by CircuitPlayground(portCache=True), see there.'''
+        self.emuMode = False
+        self.comPort = comport
+        self.serialNumber = None
+        self.portCache = portCache
+        self.baudrate = baudrate
+        self.timeout = timeout # for reads
+        self._reader = None
+        self._writer = None
+        self._lock = asyncio.Lock()
+        self._timedOut = False # a late response of a timed out or failed command may still arrive
+        self._lastCmd = None # responses which arrive after it are reported at the start of the next command
+
+    async def connect(self) -> None:
+        '''Connect to CircuitPlayground via serial com port.'''
+        try:
+            import serial_asyncio
+        except ImportError:
+            raise Exception('ERROR in cpg_scpi: pyserial-asyncio is needed for AsyncCircuitPlayground. Install it with "pip install pyserial-asyncio".') from None
+        if (self.comPort is None) or (self.comPort == '') or (self.comPort == 'auto'):
+            self._findComPort()
+        if self.emuMode:
+            raise Exception('ERROR in cpg_scpi: Emulation mode is not implemented for AsyncCircuitPlayground.')
+        self._reader, self._writer = await serial_asyncio.open_serial_connection(url=self.comPort, baudrate=self.baudrate)
+        print(f'Connected to {self.comPort} with {self.baudrate} baud (bit/second).')
+
+    async def close(self) -> None:
+        '''Close com port connection.'''
+        if self.is_open:
+            print(f'Closing {self.comPort}')
+            writer = self._writer
+            writer.close()
+            self._writer = None
+            if hasattr(writer, 'wait_closed'): # Python 3.7+
+                await writer.wait_closed()
+            self._reader = None
+
+    async def __aenter__(self) -> 'AsyncCircuitPlayground':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *excInfo) -> None:
+        await self.close()
+
+    @property
+    def is_open(self) -> bool:
+        '''Return True or False depending on if serial com port is connected.'''
+        return self._writer is not None
+
+    async def idn(self) -> str:
+        '''Identify connected CircuitPlayground.'''
+        return await self._query('*IDN?', 6)
+
+    async def config(self) -> str:
+        '''Query configuration parameters of CircuitPlayground.'''
+        return await self._query('SYST:CON?', 9)
+
+    # Readers like acc() and acc_wts() are generated from cpg_scpi._MEASUREMENTS, see the end of this module.
+
+    async def snapshot(self, names: List[str] = ('acc', 'light', 'temp', 'touch')) -> dict:
+        '''Measure several sensors with a single round trip and return a dict with the reader names as keys. See CircuitPlayground.snapshot().'''
+        cmds = []
+        parsers = []
+        for name in names:
+            withTimestamp = name.endswith('_wts')
+            measurement = _MEASUREMENTS_BY_NAME.get(name[:-4] if withTimestamp else name)
+            if measurement is None:
+                raise Exception(f'ERROR in cpg_scpi: "{name}" cannot be used in snapshot().')
+            cmds.append(measurement.cmd)
+            parsers.append(measurement.parseWts if withTimestamp else measurement.parse)
+        async with self._lock:
+            await self._prepareCommand()
+            self._writer.write(b''.join(_encode(cmd) for cmd in cmds))
+            responses = [await self._readline() for cmd in cmds]
+            self._lastCmd = cmds[-1]
+        return {name: parser(response) for name, parser, response in zip(names, parsers, responses)}
+
+    # LEDs:
+
+    async def led(self, value) -> None:
+        '''Control the 10 neopixel LEDs with a value between 0 (all off) and 1023 (all on).'''
+        print(f'LEDs {value:010b}')
+        await self._query(f'OUT:LED {int(value)}', 0)
+
+    async def ledDemo(self) -> None:
+        '''Briefly flash all 10 neopixel LEDs with different colors.'''
+        print(f'LEDs {1023:010b}')
+        print(f'LEDs {0:010b}')
+        await self._query('OUT:DEMO:LED', 0)
+
+    # Streaming:
+
+    async def stream(self, cmd: str = 'MEAS:ACC?', interval_ms: int = 10, count: int = -1) -> AsyncIterator[tuple]:
+        '''Let the CPG repeat the measurement cmd every interval_ms milli-seconds and yield the samples with timestamp.
+        count is the number of measurements, -1 for endless streaming until the async for loop is left.
+        Example:  async for timestamp, x, y, z in cpg.stream('MEAS:ACC?', 10): ...
+        The stream holds the connection lock until it ends, so other commands wait for it. An async for loop which is
+        left with break does not end the stream by itself; close the generator explicitly:
+            samples = cpg.stream('MEAS:ACC?', 10)
+            try:
+                async for timestamp, x, y, z in samples:
+                    if z > 5: break
+            finally:
+                await samples.aclose() # sends MEAS:STOP and releases the lock
+        '''
+        if cmd not in _MEASUREMENTS_BY_CMD:
+            raise Exception(f'ERROR in cpg_scpi: Streaming is not supported for "{cmd}".')
+        parser = _MEASUREMENTS_BY_CMD[cmd].parseWts
+        async with self._lock:
+            await self._prepareCommand()
+            self._writer.write(f'SYST:CON:MEAS:TINT {int(interval_ms)}\nSYST:CON:MEAS:COUNT {int(count)}\n{cmd}\n'.encode('utf-8'))
+            try:
+                received = 0
+                while count < 0 or received < count:
+                    response = await self._readline(timeout=None)
+                    received += 1
+                    yield parser(response)
+            finally:
+                self._writer.write('MEAS:STOP\nSYST:CON:MEAS:COUNT 1\n'.encode('utf-8'))
+                # Discard samples which were sent before MEAS:STOP was processed by the CPG:
+                await self._discardInput(0.05)
+
+    # Timing:
+
+    async def wait(self, seconds: float = 0):
+        '''Waits for seconds without blocking the event loop, e.g. 0.1 for 100 milli-seconds'''
+        await asyncio.sleep(seconds)
+
+    async def _query(self, cmd: str, expectedLines: int) -> str:
+        '''Send command or query to CPG and receive response, if any. Also do some error detection.'''
+        async with self._lock:
+            await self._prepareCommand()
+            self._writer.write(_encode(cmd))
+            response = ''
+            for i in range(expectedLines):
+                response += await self._readline() + '\n'
+            self._lastCmd = cmd
+            return response.strip() # remove leading and trailing whitespace
+
+    async def _readline(self, timeout: float = -1) -> str:
+        '''Read one response line. A timeout of -1 uses the timeout of the object, None waits forever.'''
+        if timeout == -1:
+            timeout = self.timeout
+        try:
+            received = (await asyncio.wait_for(self._reader.readline(), timeout)).decode('utf-8')
+        except asyncio.TimeoutError:
+            self._timedOut = True
+            raise CpgTimeoutError(f'ERROR in cpg_scpi.{sys._getframe().f_code.co_name}(): TIMEOUT while waiting for a response.') from None
+        if received.startswith('ERROR'):
+            self._timedOut = True # the rest of the failed response, if any, is discarded before the next command
+            raise CpgResponseError(f'CPG-ERROR in cpg_scpi.{sys._getframe().f_code.co_name}(): "{received.strip()}"')
+        return received.strip()
+
+    async def _prepareCommand(self) -> None:
+        '''Resynchronise before the next write: discard the late response of a timed out or failed command, and report
+        responses which arrived after the previous command, like the query policy 'deferred' of CircuitPlayground.'''
+        if self._timedOut:
+            self._timedOut = False
+            self._lastCmd = None
+            await self._discardInput(0.05)
+            return
+        if self._lastCmd is None:
+            return
+        lastCmd, self._lastCmd = self._lastCmd, None
+        await asyncio.sleep(0) # let the transport pass on data which has already arrived
+        unexpected = ''
+        while b'\n' in self._reader._buffer: # StreamReader has no public counterpart of in_waiting
+            unexpected += (await self._reader.readline()).decode('utf-8')
+        if unexpected.startswith('ERROR'):
+            raise CpgResponseError(f'CPG-ERROR in cpg_scpi.{sys._getframe().f_code.co_name}(): "{unexpected.strip()}" after "{lastCmd}"')
+        if unexpected:
+            raise CpgResponseError(f'ERROR in cpg_scpi.{sys._getframe().f_code.co_name}(): UNEXPECTED RESPONSE after "{lastCmd}": "{unexpected.strip()}"')
+
+    async def _discardInput(self, quietTime: float) -> None:
+        '''Read and discard input until nothing was received for quietTime seconds.'''
+        try:
+            while True:
+                await asyncio.wait_for(self._reader.readline(), quietTime)
+        except asyncio.TimeoutError:
+            pass
+
+    # Port discovery is shared with CircuitPlayground:
+
+    _findComPort = CircuitPlayground._findComPort
+
+
+def _reader(cmd: str, parse):
+    async def reader(self):
+        return parse(await self._query(cmd, 1))
+    return reader
+
+for _measurement in _MEASUREMENTS:
+    _addMethod(AsyncCircuitPlayground, _measurement.name, _reader(_measurement.cmd, _measurement.parse), _measurement.doc, _measurement.returns)
+    if _measurement.count > 0:
+        _addMethod(AsyncCircuitPlayground, _measurement.name + '_wts', _reader(_measurement.cmd, _measurement.parseWts), _measurement.docWts, _measurement.returnsWts)
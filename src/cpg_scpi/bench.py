@@ -0,0 +1,209 @@
+'''Benchmarks for CPG SCPI
+
+Measures latency percentiles, throughput and host CPU time for every reader, LED writes, snapshot(), block
+acquisition and streaming. Run it from the command line against a real board or the virtual device:
+
+    python -m cpg_scpi bench
+    python -m cpg_scpi bench --port virtual --latency 0.002 --json results.json
+    python -m cpg_scpi bench --port COM9 --query-policy deferred --iterations 500
+
+The JSON output can be used to compare different versions of cpg_scpi or different query policies.
+'''
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, List
+
+from . import CircuitPlayground, _MEASUREMENTS, __version__
+from .metrics import _MeteredTransport
+
+
+# Every reader of the registry, with the variant with timestamp where there is one:
+READERS = tuple(name for measurement in _MEASUREMENTS
+                for name in ((measurement.name, measurement.name + '_wts') if measurement.count > 0 else (measurement.name,)))
+
+
+def _percentile(sortedValues: List[float], percent: float) -> float:
+    '''Nearest-rank percentile of an already sorted list.'''
+    index = max(0, min(len(sortedValues) - 1, round(percent / 100 * len(sortedValues)) - 1))
+    return sortedValues[index]
+
+
+def benchCall(cpg: CircuitPlayground, name: str, call: Callable, iterations: int, samplesPerCall: int = 1, finish: Callable = None) -> dict:
+    '''Call call() iterations times and return latency percentiles, throughput and CPU time.
+    finish() is called after the last call, e.g. to wait for background writes. It counts for the throughput only.'''
+    counter = _MeteredTransport(cpg.comPortObj)
+    cpg.comPortObj = counter
+    latencies = []
+    try:
+        with contextlib.redirect_stdout(io.StringIO()): # led() prints each value
+            cpuStart = time.process_time()
+            start = time.perf_counter()
+            for i in range(iterations):
+                callStart = time.perf_counter()
+                call()
+                latencies.append(time.perf_counter() - callStart)
+            if finish is not None:
+                finish()
+            total = time.perf_counter() - start
+            cpu = time.process_time() - cpuStart
+    finally:
+        cpg.comPortObj = counter._transport
+    latencies.sort()
+    return {
+        'name': name,
+        'iterations': iterations,
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p90_ms': _percentile(latencies, 90) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+        'mean_ms': total / iterations * 1000,
+        'samples_per_s': iterations * samplesPerCall / total,
+        'bytes_per_s': (counter._bytesWritten + counter._bytesRead) / total,
+        'cpu_s': cpu,
+    }
+
+
+def benchStream(cpg: CircuitPlayground, cmd: str, interval_ms: int, duration: float) -> dict:
+    '''Stream cmd for duration seconds and return the achieved sample rate and CPU time.'''
+    counter = _MeteredTransport(cpg.comPortObj)
+    cpg.comPortObj = counter
+    samples = 0
+    try:
+        cpuStart = time.process_time()
+        start = time.perf_counter()
+        cpg.start_stream(cmd, interval_ms)
+        while time.perf_counter() - start < duration:
+            time.sleep(0.01)
+            samples += len(cpg.read_stream())
+        cpg.stop_stream()
+        samples += len(cpg.read_stream())
+        total = time.perf_counter() - start
+        cpu = time.process_time() - cpuStart
+    finally:
+        cpg.comPortObj = counter._transport
+    return {
+        'name': f'stream {cmd} {interval_ms} ms',
+        'iterations': samples,
+        'p50_ms': None,
+        'p90_ms': None,
+        'p99_ms': None,
+        'mean_ms': total / max(1, samples) * 1000,
+        'samples_per_s': samples / total,
+        'bytes_per_s': (counter._bytesWritten + counter._bytesRead) / total,
+        'cpu_s': cpu,
+    }
+
+
+def runBenchmarks(cpg: CircuitPlayground, iterations: int = 100, streamDuration: float = 2.0) -> List[dict]:
+    '''Run all benchmarks on cpg and return a list with one result dict per benchmark.'''
+    results = []
+    for name in READERS:
+        results.append(benchCall(cpg, name, getattr(cpg, name), iterations))
+    results.append(benchCall(cpg, 'led', lambda: cpg.led(0b1010101010), iterations))
+    values = iter(range(iterations))
+    results.append(benchCall(cpg, 'led wait=False', lambda: cpg.led(next(values) % 1024, wait=False), iterations,
+                             finish=cpg.led_channel.flush))
+    snapshotNames = ['acc', 'light', 'temp', 'touch']
+    results.append(benchCall(cpg, 'snapshot ' + ','.join(snapshotNames), lambda: cpg.snapshot(snapshotNames), iterations, len(snapshotNames)))
+    try:
+        import numpy
+    except ImportError:
+        print('numpy is not installed, skipping block benchmarks.')
+    else:
+        blockSize = 100
+        results.append(benchCall(cpg, f'acc_block {blockSize}', lambda: cpg.acc_block(blockSize), max(1, iterations // 10), blockSize))
+    results.append(benchStream(cpg, 'MEAS:ACC?', 1, streamDuration))
+    return results
+
+
+def benchStartup(repeats: int = 10) -> List[dict]:
+    '''Measure the time for "import cpg_scpi" in a fresh interpreter and for creating a CircuitPlayground on the virtual device.'''
+    def interpreterTimes(code: str) -> List[float]:
+        times = []
+        for i in range(repeats):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], check=True)
+            times.append(time.perf_counter() - start)
+        return sorted(times)
+    baseline = interpreterTimes('pass')
+    withImport = interpreterTimes('import cpg_scpi')
+    from .virtual import VirtualDevice
+    constructorTimes = []
+    with contextlib.redirect_stdout(io.StringIO()): # the constructor prints idn() and config()
+        for i in range(repeats):
+            start = time.perf_counter()
+            CircuitPlayground(VirtualDevice()).close()
+            constructorTimes.append(time.perf_counter() - start)
+    constructorTimes.sort()
+    def result(name: str, times: List[float]) -> dict:
+        return {
+            'name': name,
+            'iterations': repeats,
+            'p50_ms': _percentile(times, 50) * 1000,
+            'p90_ms': _percentile(times, 90) * 1000,
+            'p99_ms': _percentile(times, 99) * 1000,
+            'mean_ms': sum(times) / repeats * 1000,
+            'samples_per_s': repeats / sum(times),
+            'bytes_per_s': 0,
+            'cpu_s': None,
+        }
+    importTimes = sorted(t - _percentile(baseline, 50) for t in withImport)
+    return [result('import cpg_scpi (minus bare python)', importTimes), result('CircuitPlayground(VirtualDevice())', constructorTimes)]
+
+
+def printResults(results: List[dict]) -> None:
+    '''Print the results as a table.'''
+    def ms(value):
+        return '       -' if value is None else f'{value:8.2f}'
+    def cpu(value):
+        return '     -' if value is None else f'{value:6.2f}'
+    print(f'| {"benchmark":32} |   p50 ms |   p90 ms |   p99 ms | samples/s |  bytes/s |  cpu s |')
+    for r in results:
+        print(f'| {r["name"]:32} | {ms(r["p50_ms"])} | {ms(r["p90_ms"])} | {ms(r["p99_ms"])} | {r["samples_per_s"]:9.1f} | {r["bytes_per_s"]:8.0f} | {cpu(r["cpu_s"])} |')
+
+
+def main(argv: List[str] = None) -> None:
+    '''Command line interface, see module docstring.'''
+    parser = argparse.ArgumentParser(prog='python -m cpg_scpi bench', description='Benchmark cpg_scpi against a board or the virtual device.')
+    parser.add_argument('--port', default='auto', help="com port, 'auto' (default) or 'virtual'")
+    parser.add_argument('--query-policy', default='strict', choices=CircuitPlayground.QUERY_POLICIES)
+    parser.add_argument('--iterations', type=int, default=100, help='calls per benchmark (default 100)')
+    parser.add_argument('--stream-duration', type=float, default=2.0, help='seconds for the stream benchmark (default 2)')
+    parser.add_argument('--latency', type=float, default=0.0, help='response latency of the virtual device in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='response jitter of the virtual device in seconds')
+    parser.add_argument('--startup', action='store_true', help='also measure import time and constructor time')
+    parser.add_argument('--json', metavar='FILE', help='write the results as JSON to FILE')
+    args = parser.parse_args(argv)
+
+    port = args.port
+    if port == 'virtual':
+        from .virtual import VirtualDevice
+        port = VirtualDevice(latency=args.latency, jitter=args.jitter)
+    cpg = CircuitPlayground(port, queryPolicy=args.query_policy)
+    try:
+        results = runBenchmarks(cpg, args.iterations, args.stream_duration)
+    finally:
+        cpg.close()
+    if args.startup:
+        results += benchStartup()
+    printResults(results)
+    if args.json:
+        report = {
+            'cpg_scpi': __version__,
+            'python': platform.python_version(),
+            'port': args.port,
+            'query_policy': args.query_policy,
+            'virtual_latency': args.latency if args.port == 'virtual' else None,
+            'virtual_jitter': args.jitter if args.port == 'virtual' else None,
+            'emulation': cpg.emuMode,
+            'results': results,
+        }
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Results written to {args.json}')
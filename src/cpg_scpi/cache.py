@@ -0,0 +1,129 @@
+'''Response cache for CPG SCPI
+
+ResponseCache keeps the responses of slowly changing queries for a configurable time to live (TTL), and lets
+concurrent callers of the same query share a single round trip (single-flight). Use it via
+CircuitPlayground.enable_cache():
+
+    cpg.enable_cache({'temp': 2.0, 'switch': 0.1})   # reader names or SCPI commands, TTL in seconds
+    cpg.temp()                                       # round trip
+    cpg.temp()                                       # from the cache for the next 2 seconds
+    print(cpg.cache.stats())
+
+Responses of '*IDN?' and 'SYST:CON?' are cached until a 'SYST:' or '*RST' command is sent, which clears the cache.
+'''
+
+import collections
+import threading
+import time
+from typing import Callable, Dict, List
+
+DEFAULT_TTLS = {
+    '*IDN?': None,     # None: until the cache is cleared
+    'SYST:CON?': None,
+    'MEAS:TEMP?': 1.0,
+}
+
+_NOT_CACHED = object()
+
+
+class _Flight:
+    '''A query in progress, which other callers of the same query wait for.'''
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class ResponseCache:
+    '''LRU cache with a TTL per SCPI command and single-flight de-duplication of concurrent queries.'''
+
+    def __init__(self, ttls: Dict[str, float] = None, maxSize: int = 64) -> None:
+        '''ttls maps SCPI commands to the time to live of their responses in seconds (None: until clear()).
+        Commands without an entry are not cached, but concurrent calls are still de-duplicated.'''
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0 # callers which waited for the query of another caller
+        self._entries = collections.OrderedDict() # cmd -> (time, response)
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, cmd: str, query: Callable, *args) -> str:
+        '''Return the cached response of cmd, the response of a running query(cmd, *args) of another thread,
+        or the response of a new query(cmd, *args).'''
+        with self._lock:
+            response = self._lookup(cmd, time.monotonic())
+            if response is not _NOT_CACHED:
+                return response
+            flight = self._flights.get(cmd)
+            if flight is not None:
+                self.shared += 1
+                leader = False
+            else:
+                flight = self._flights[cmd] = _Flight()
+                leader = True
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+        try:
+            flight.response = query(cmd, *args)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[cmd]
+                if flight.error is None:
+                    self._store(cmd, flight.response, time.monotonic())
+            flight.done.set()
+        return flight.response
+
+    def fetchMany(self, cmds: List[str], queryMany: Callable) -> List[str]:
+        '''Return the responses of cmds, taking the cached ones from the cache and the others from one queryMany(missing).'''
+        with self._lock:
+            now = time.monotonic()
+            cached = {cmd: self._lookup(cmd, now) for cmd in set(cmds)}
+        missing = [cmd for cmd in cmds if cached[cmd] is _NOT_CACHED]
+        if not missing:
+            return [cached[cmd] for cmd in cmds]
+        responses = queryMany(missing)
+        with self._lock:
+            now = time.monotonic()
+            for cmd, response in zip(missing, responses):
+                self._store(cmd, response, now)
+        queried = iter(responses)
+        return [next(queried) if cached[cmd] is _NOT_CACHED else cached[cmd] for cmd in cmds]
+
+    def clear(self) -> None:
+        '''Remove all cached responses.'''
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        '''Return the number of cache hits, misses, shared in-flight queries and cached responses.'''
+        return {'hits': self.hits, 'misses': self.misses, 'shared': self.shared, 'size': len(self._entries)}
+
+    def _lookup(self, cmd: str, now: float):
+        entry = self._entries.get(cmd)
+        if entry is not None:
+            ttl = self.ttls.get(cmd)
+            if ttl is None or now - entry[0] < ttl:
+                self._entries.move_to_end(cmd)
+                self.hits += 1
+                return entry[1]
+            del self._entries[cmd]
+        if cmd in self.ttls:
+            self.misses += 1
+        return _NOT_CACHED
+
+    def _store(self, cmd: str, response: str, now: float) -> None:
+        if cmd not in self.ttls:
+            return
+        self._entries[cmd] = (now, response)
+        self._entries.move_to_end(cmd)
+        while len(self._entries) > self.maxSize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,86 @@
+'''Capacitive sensing with the 8 touch pads
+
+The raw readings of MEAS:CAP:SENSE? allow touch detection with own thresholds at a high rate, instead of polling
+the thresholded bitmask of touch(). CapSenseBuffer stores streamed readings compactly as int16, and calibrate()
+measures the baseline of each pad and returns a threshold per pad for touch detection on the host. The CPG has only
+one threshold for all pads (SYST:CON:MEAS:CAPLIM), which calibrate() sets on request.
+
+    from cpg_scpi.capsense import CapSenseBuffer
+
+    baselines, thresholds, capLimit = cpg.calibrate_touch()   # do not touch the pads meanwhile
+    buffer = CapSenseBuffer(100000)
+    cpg.start_stream('MEAS:CAP:SENSE?', interval_ms=5, sink=buffer)
+    ...
+    timestamps, values = buffer.read()                         # float64 (n,) and int16 (n, 8)
+    touched = values > thresholds
+'''
+
+import array
+import threading
+from typing import Tuple
+
+from . import _importNumpy
+
+PADS = 8
+
+
+class CapSenseBuffer:
+    '''Ring buffer for (timestamp, pad0, ..., pad7) samples with the pad values stored as int16.
+    Can be used as sink of CircuitPlayground.start_stream(). Needs no numpy, except for read().'''
+
+    def __init__(self, capacity: int = 100000) -> None:
+        self.capacity = capacity
+        self.dropped = 0 # oldest samples overwritten because the buffer was full
+        self._timestamps = array.array('d', bytes(8 * capacity))
+        self._values = array.array('h', bytes(2 * PADS * capacity))
+        self._start = 0 # index of the oldest sample
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def put(self, sample: Tuple) -> bool:
+        '''Store a sample (timestamp, pad0, ..., pad7). If the buffer is full, the oldest sample is overwritten.'''
+        with self._lock:
+            if self._count == self.capacity:
+                self._start = (self._start + 1) % self.capacity
+                self._count -= 1
+                self.dropped += 1
+            index = (self._start + self._count) % self.capacity
+            self._timestamps[index] = sample[0]
+            self._values[index * PADS:(index + 1) * PADS] = array.array('h', sample[1:])
+            self._count += 1
+        return True
+
+    def read(self):
+        '''Remove all samples and return them as numpy arrays timestamps with shape (n,) and values with shape (n, 8) and dtype int16.'''
+        np = _importNumpy()
+        with self._lock:
+            order = (np.arange(self._count) + self._start) % self.capacity
+            timestamps = np.frombuffer(self._timestamps, dtype=np.float64)[order]
+            values = np.frombuffer(self._values, dtype=np.int16).reshape(self.capacity, PADS)[order]
+            self._start = (self._start + self._count) % self.capacity
+            self._count = 0
+        return timestamps, values
+
+
+def calibrate(cpg, n: int = 100, interval_ms: int = 10, sigmas: float = 5.0, minDelta: int = 50, setCapLimit: bool = False):
+    '''Measure the untouched pads n times and return (baselines, thresholds, capLimit).
+    baselines are the mean values per pad, thresholds = baseline + max(minDelta, sigmas * standard deviation) per pad,
+    both as numpy arrays with 8 values. Use thresholds for touch detection on the host, e.g. values > thresholds.
+    capLimit is the highest threshold, the only single limit above the noise of every pad. If setCapLimit is True, it is
+    set as CAPLIM of the CPG for touch(). Pads with a lower threshold then need a stronger touch, so a warning is printed
+    if the thresholds differ by more than minDelta.'''
+    np = _importNumpy()
+    timestamps, values = cpg.capSense_block(n, interval_ms)
+    baselines = values.mean(axis=0)
+    thresholds = baselines + np.maximum(minDelta, sigmas * values.std(axis=0))
+    capLimit = int(np.ceil(thresholds.max()))
+    if setCapLimit:
+        spread = thresholds.max() - thresholds.min()
+        if spread > minDelta:
+            print(f'WARNING in cpg_scpi: The thresholds of the pads differ by {spread:.0f}. With CAPLIM {capLimit}, touch() misses')
+            print( '                     light touches of the pads with low thresholds. Compare with the thresholds on the host instead.')
+        cpg.setCapLimit(capLimit)
+    return baselines, thresholds, capLimit
@@ -0,0 +1,90 @@
+'''Clock model to map CPG timestamps to host time
+
+Every measurement response of the CPG starts with the CPG uptime in milli-seconds. The host knows when the
+query was sent and when the response was received, so each response brackets the CPG time between two host
+times. BoardClock collects these observations and fits offset and drift of the CPG clock against the host's
+time.monotonic() clock. Observations with a short round trip are preferred, because they bracket the CPG time
+more tightly. At most one observation per spacing seconds is kept, the one with the shortest round trip, such
+that the window spans enough time for a drift estimate even at high query rates.
+'''
+
+import collections
+import time
+from typing import Tuple
+
+
+class BoardClock:
+    '''Estimates offset and drift between the CPG uptime counter and the host clock.'''
+
+    WRAP_MS = 2**32 # millis() on the CPG is an unsigned 32 bit counter and wraps after approx. 49.7 days
+
+    def __init__(self, windowSize: int = 64, spacing: float = 1.0) -> None:
+        self.spacing = spacing # seconds of CPG time per kept observation
+        self._observations = collections.deque(maxlen=windowSize) # (boardTime, hostTime, roundTrip) in seconds
+        self._lastMs = None
+        self._wrapCount = 0
+        self._model = None
+        self.resets = 0
+
+    def observe(self, boardMs: int, sendTime: float, receiveTime: float) -> None:
+        '''Add an observation: a CPG timestamp in milli-seconds received between the host times sendTime and receiveTime.'''
+        if self._lastMs is not None and boardMs < self._lastMs:
+            if self._lastMs - boardMs > self.WRAP_MS // 2:
+                self._wrapCount += 1 # the 32 bit counter wrapped around
+            else:
+                self.reset() # the CPG was restarted
+                self.resets += 1
+        self._lastMs = boardMs
+        boardTime = (boardMs + self._wrapCount * self.WRAP_MS) / 1000
+        observation = (boardTime, (sendTime + receiveTime) / 2, receiveTime - sendTime)
+        if self._observations and boardTime // self.spacing == self._observations[-1][0] // self.spacing:
+            # Same time slot as the previous observation, keep the tighter one:
+            if observation[2] >= self._observations[-1][2]:
+                return
+            self._observations[-1] = observation
+        else:
+            self._observations.append(observation)
+        self._model = None
+
+    def reset(self) -> None:
+        '''Forget all observations, e.g. after the CPG was restarted.'''
+        self._observations.clear()
+        self._lastMs = None
+        self._wrapCount = 0
+        self._model = None
+
+    @property
+    def model(self) -> Tuple[float, float]:
+        '''Return the current estimate (offset, drift) with hostTime = offset + (1+drift) * boardTime.'''
+        if self._model is None:
+            self._model = self._fit()
+        return self._model
+
+    def to_host_time(self, timestamp: float) -> float:
+        '''Convert a CPG timestamp in seconds (as returned by the _wts methods) to host time.monotonic() seconds.
+        The timestamp is unwrapped to the wrap around of the 32 bit counter closest to the last observed CPG time.'''
+        offset, drift = self.model
+        wrap = self.WRAP_MS / 1000
+        lastTime = (self._lastMs + self._wrapCount * self.WRAP_MS) / 1000
+        return offset + (1 + drift) * (timestamp + round((lastTime - timestamp) / wrap) * wrap)
+
+    def to_wall_time(self, timestamp: float) -> float:
+        '''Convert a CPG timestamp in seconds (as returned by the _wts methods) to host time.time() seconds.'''
+        return self.to_host_time(timestamp) + (time.time() - time.monotonic())
+
+    def _fit(self) -> Tuple[float, float]:
+        if len(self._observations) == 0:
+            raise Exception('ERROR in cpg_scpi: No timestamps observed yet. Do some measurements before converting timestamps.')
+        # Only use the observations with the shortest round trips:
+        roundTrips = sorted(o[2] for o in self._observations)
+        limit = roundTrips[len(roundTrips) // 2]
+        points = [(b, h) for b, h, r in self._observations if r <= limit]
+        n = len(points)
+        meanB = sum(b for b, h in points) / n
+        meanH = sum(h for b, h in points) / n
+        varB = sum((b - meanB)**2 for b, h in points)
+        if n < 2 or varB < 1.0:
+            # Not enough spread in time for a drift estimate yet:
+            return meanH - meanB, 0.0
+        slope = sum((b - meanB) * (h - meanH) for b, h in points) / varB
+        return meanH - slope * meanB, slope - 1
@@ -0,0 +1,148 @@
+'''Edge-triggered events for buttons, switch and touch pads
+
+A single poller measures all subscribed inputs with one snapshot() round trip per poll interval, debounces them
+and calls the callbacks only when an input changes. Use it via CircuitPlayground.on() and on_touch():
+
+    def pressed(event):
+        print('left button pressed at', event.timestamp)
+        cpg.led(0b1111111111)
+
+    cpg.on('buttonLeft', down=pressed, up=lambda event: cpg.led(0))
+    cpg.on_touch(3, lambda event: print('pad 3 touched'))
+    cpg.run_events(duration=60)          # dispatch in this thread, or:
+    cpg.start_events()                   # dispatch in a background thread until cpg.stop_events()
+'''
+
+import collections
+import time
+from typing import Callable, Dict, List
+
+# source: input name, e.g. 'buttonLeft' or 'touch'
+# pad:    number of the touch pad (bit in the MEAS:CAP:TAP? response), None for the other inputs
+# state:  True for pressed, touched or switched on
+# timestamp: CPG timestamp in seconds of the sample which completed the debouncing
+Event = collections.namedtuple('Event', 'source pad state timestamp')
+
+SOURCES = ('buttonAny', 'buttonLeft', 'buttonRight', 'switch', 'touch')
+
+
+class _Input:
+    '''Debounced state of a single input with its callbacks.'''
+
+    def __init__(self, source: str, pad: int, debounce: float) -> None:
+        self.source = source
+        self.pad = pad
+        self.debounce = debounce
+        self.down: List[Callable] = []
+        self.up: List[Callable] = []
+        self.state = None      # debounced state, None until the first sample
+        self.candidate = None  # raw state which differs from state
+        self.since = 0.0       # timestamp when candidate was first seen
+
+    def update(self, raw: bool, timestamp: float):
+        '''Feed a raw sample and return an Event if the debounced state changed, otherwise None.'''
+        if self.state is None:
+            self.state = raw # initial state, no event
+            return None
+        if raw == self.state:
+            self.candidate = None
+            return None
+        if raw != self.candidate:
+            self.candidate = raw
+            self.since = timestamp
+        if timestamp - self.since < self.debounce:
+            return None
+        self.state = raw
+        self.candidate = None
+        return Event(self.source, self.pad, raw, timestamp)
+
+
+class EventEngine:
+    '''Polls the subscribed inputs of a CircuitPlayground and dispatches edge events. Created by CircuitPlayground.on().'''
+
+    def __init__(self, cpg) -> None:
+        self.cpg = cpg
+        self.inputs: Dict[tuple, _Input] = {}
+        self.polls = 0
+        self._thread = None
+        self._running = False
+        self._error = None
+
+    def subscribe(self, source: str, pad: int, down: Callable, up: Callable, debounce_ms: float) -> None:
+        if source not in SOURCES:
+            raise Exception(f'ERROR in cpg_scpi: Events are not supported for "{source}". Use one of {SOURCES}.')
+        if source == 'touch' and not 0 <= pad <= 7:
+            raise Exception(f'ERROR in cpg_scpi: Touch pad {pad} does not exist. Use 0 ... 7.')
+        key = (source, pad)
+        if key not in self.inputs:
+            self.inputs[key] = _Input(source, pad, debounce_ms / 1000)
+        if down is not None:
+            self.inputs[key].down.append(down)
+        if up is not None:
+            self.inputs[key].up.append(up)
+
+    def poll(self) -> List[Event]:
+        '''Measure all subscribed inputs once, dispatch the events and return them.'''
+        sources = sorted({source for source, pad in self.inputs})
+        if not sources:
+            return []
+        values = self.cpg.snapshot([source + '_wts' for source in sources])
+        self.polls += 1
+        events = []
+        for (source, pad), input in list(self.inputs.items()):
+            timestamp, value = values[source + '_wts']
+            raw = bool((value >> pad) & 1) if source == 'touch' else value
+            event = input.update(raw, timestamp)
+            if event is not None:
+                events.append(event)
+                for callback in (input.down if event.state else input.up):
+                    callback(event)
+        return events
+
+    def run(self, duration: float = None, interval_ms: float = 10) -> None:
+        '''Poll every interval_ms milli-seconds until duration seconds are over (endless for None) or stop() is called.
+        Deadlines are absolute, such that the time needed for callbacks does not add up.'''
+        self._running = True
+        self._loop(duration, interval_ms)
+
+    def _loop(self, duration: float, interval_ms: float) -> None:
+        interval = interval_ms / 1000
+        start = nextTime = time.monotonic()
+        while self._running and (duration is None or nextTime - start < duration):
+            self.poll()
+            nextTime += interval
+            delay = nextTime - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                nextTime = time.monotonic() # too slow, do not try to catch up
+        self._running = False
+
+    def start(self, interval_ms: float = 10) -> None:
+        '''Run the poller in a background thread. Callbacks are called in this thread.'''
+        import threading
+        if self._thread is not None:
+            raise Exception('ERROR in cpg_scpi: Events are already running. Call stop_events() first.')
+        self._error = None
+        self._running = True
+        self._thread = threading.Thread(target=self._background, args=(interval_ms,), name='cpg_scpi-events', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        '''Stop the poller. Raise the exception of a callback or a measurement, if the background poller stopped because of it.'''
+        self._running = False
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            import threading
+            if thread is not threading.current_thread(): # stop() may be called from a callback
+                thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _background(self, interval_ms: float) -> None:
+        try:
+            self._loop(None, interval_ms)
+        except Exception as e:
+            self._error = e
+            self._running = False
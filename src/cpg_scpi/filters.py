@@ -0,0 +1,275 @@
+'''Online filters for sensor values
+
+Incremental filters with O(1) work per sample, for single values from the readers and, vectorized, for blocks
+and stream samples. A filter keeps its state between calls, such that blocks can be filtered piece by piece.
+Tuples, e.g. from acc(), are filtered per channel.
+
+    from cpg_scpi.filters import MovingAverage, EMA, LowPass, RollingRMS, RollingMinMax, Chain
+
+    smooth = MovingAverage(10)
+    x, y, z = smooth.update(cpg.acc())                 # single samples from a reader
+
+    lowPass = LowPass(cutoff=5, sampleRate=100)
+    filtered = lowPass.update_block(cpg.acc_block(500, interval_ms=10)[:, 1:])   # without the timestamp column
+
+    chain = Chain(MovingAverage(5), EMA(0.2))
+    levels = chain.update_block([light for timestamp, light in cpg.read_stream()])
+
+    cpg.start_stream('MEAS:ACC?', 10, filter=LowPass(cutoff=5, sampleRate=100))   # filtered while streaming
+    t, x, y, z = MovingAverage(10).update_wts(cpg.acc_wts())                       # keeps the timestamp
+
+update() needs no numpy. update_block() needs numpy and returns a numpy array with one row per sample.
+The IIR filters EMA and LowPass use scipy.signal.lfilter for blocks if scipy is installed
+(pip install cpg_scpi[scipy]), otherwise they filter blocks sample by sample.
+'''
+
+import collections
+import math
+from typing import Sequence
+
+from . import _importNumpy
+
+
+def _lfilter():
+    '''Return scipy.signal.lfilter, or None if scipy is not installed.'''
+    try:
+        from scipy.signal import lfilter
+    except ImportError:
+        return None
+    return lfilter
+
+
+class Filter:
+    '''Base class of the filters. Subclasses implement _newState(), _step() and _stepBlock() for a single channel.'''
+
+    def __init__(self) -> None:
+        self._states = None # one state per channel, created with the first sample
+
+    def reset(self) -> None:
+        '''Forget all previous samples.'''
+        self._states = None
+
+    def update(self, value):
+        '''Filter a single value or a tuple of values (one per channel) and return the result in the same form.'''
+        scalar = not isinstance(value, (tuple, list))
+        values = (value,) if scalar else value
+        if self._states is None:
+            self._states = [self._newState() for v in values]
+        result = tuple(self._step(state, v) for state, v in zip(self._states, values))
+        return result[0] if scalar else result
+
+    def update_wts(self, sample: tuple) -> tuple:
+        '''Filter the values of a sample with timestamp, e.g. from acc_wts() or read_stream(), and keep the timestamp.'''
+        return (sample[0], *self.update(tuple(sample[1:])))
+
+    def update_block(self, values):
+        '''Filter a block of samples, a sequence of values or of tuples with one row per sample, and return a numpy array.'''
+        np = _importNumpy()
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return values
+        columns = values.reshape(len(values), -1)
+        if self._states is None:
+            self._states = [self._newState() for i in range(columns.shape[1])]
+        results = [self._stepBlock(state, columns[:, i], np) for i, state in enumerate(self._states)]
+        result = np.stack(results, axis=1)
+        return result[:, 0] if values.ndim == 1 else result
+
+    def _newState(self):
+        raise NotImplementedError
+
+    def _step(self, state, x: float):
+        raise NotImplementedError
+
+    def _stepBlock(self, state, column, np):
+        '''Default implementation for filters without a vectorized block update.'''
+        return np.array([self._step(state, x) for x in column.tolist()])
+
+
+class MovingAverage(Filter):
+    '''Mean of the last n samples (of fewer samples while the first n samples arrive).'''
+
+    def __init__(self, n: int) -> None:
+        super().__init__()
+        if n < 1:
+            raise Exception('ERROR in cpg_scpi: The window size must be at least 1.')
+        self.n = n
+
+    def _newState(self):
+        return [collections.deque(maxlen=self.n), 0.0] # window, sum of the window
+
+    def _step(self, state, x: float) -> float:
+        window = state[0]
+        if len(window) == self.n:
+            state[1] -= window[0]
+        window.append(x)
+        state[1] += x
+        return state[1] / len(window)
+
+    def _stepBlock(self, state, column, np):
+        window = state[0]
+        extended = np.concatenate((np.array(window, dtype=np.float64), column))
+        sums = np.concatenate(([0.0], np.cumsum(extended)))
+        ends = np.arange(len(window), len(extended)) + 1
+        starts = np.maximum(0, ends - self.n)
+        window.extend(column[-self.n:].tolist())
+        state[1] = math.fsum(window) # recalculated, such that rounding errors do not accumulate
+        return (sums[ends] - sums[starts]) / (ends - starts)
+
+
+class RollingRMS(MovingAverage):
+    '''Root mean square of the last n samples.'''
+
+    def _step(self, state, x: float) -> float:
+        return math.sqrt(max(0.0, super()._step(state, x * x)))
+
+    def _stepBlock(self, state, column, np):
+        return np.sqrt(np.maximum(0.0, super()._stepBlock(state, column * column, np)))
+
+
+class EMA(Filter):
+    '''Exponential moving average y = y + alpha * (x - y), starting with the first sample.
+    For a sample rate fs and a time constant tau, use alpha = 1 - exp(-1 / (fs * tau)).'''
+
+    def __init__(self, alpha: float) -> None:
+        super().__init__()
+        if not 0 < alpha <= 1:
+            raise Exception('ERROR in cpg_scpi: alpha must be in the range 0 < alpha <= 1.')
+        self.alpha = alpha
+
+    def _newState(self):
+        return [None]
+
+    def _step(self, state, x: float) -> float:
+        state[0] = x if state[0] is None else state[0] + self.alpha * (x - state[0])
+        return state[0]
+
+    def _stepBlock(self, state, column, np):
+        lfilter = _lfilter()
+        if lfilter is None:
+            return super()._stepBlock(state, column, np)
+        y = column[0] if state[0] is None else state[0]
+        result, zi = lfilter([self.alpha], [1.0, self.alpha - 1.0], column, zi=[(1.0 - self.alpha) * y])
+        state[0] = float(result[-1])
+        return result
+
+
+class LowPass(Filter):
+    '''Second order (biquad) Butterworth low-pass filter, or with other quality factor q.
+    Starts in the steady state of the first sample, such that there is no transient from 0.'''
+
+    def __init__(self, cutoff: float, sampleRate: float, q: float = 1 / math.sqrt(2)) -> None:
+        super().__init__()
+        if not 0 < cutoff < sampleRate / 2:
+            raise Exception('ERROR in cpg_scpi: The cutoff frequency must be between 0 and half the sample rate.')
+        # Coefficients from the Audio EQ Cookbook by Robert Bristow-Johnson:
+        w0 = 2 * math.pi * cutoff / sampleRate
+        alpha = math.sin(w0) / (2 * q)
+        a0 = 1 + alpha
+        self.b = ((1 - math.cos(w0)) / 2 / a0, (1 - math.cos(w0)) / a0, (1 - math.cos(w0)) / 2 / a0)
+        self.a = (1.0, -2 * math.cos(w0) / a0, (1 - alpha) / a0)
+
+    def _newState(self):
+        return [None, 0.0, 0.0] # initialized, z1, z2 of the transposed direct form II
+
+    def _initState(self, state, x: float) -> None:
+        (b0, b1, b2), (a0, a1, a2) = self.b, self.a
+        state[:] = [True, x * (1 - b0), x * (b2 - a2)] # steady state for constant input x
+
+    def _step(self, state, x: float) -> float:
+        if state[0] is None:
+            self._initState(state, x)
+        (b0, b1, b2), (a0, a1, a2) = self.b, self.a
+        y = b0 * x + state[1]
+        state[1] = b1 * x - a1 * y + state[2]
+        state[2] = b2 * x - a2 * y
+        return y
+
+    def _stepBlock(self, state, column, np):
+        lfilter = _lfilter()
+        if lfilter is None:
+            return super()._stepBlock(state, column, np)
+        if state[0] is None:
+            self._initState(state, float(column[0]))
+        result, zi = lfilter(self.b, self.a, column, zi=state[1:])
+        state[1:] = zi.tolist()
+        return result
+
+
+class RollingMinMax(Filter):
+    '''Minimum and maximum of the last n samples, returned as tuple (min, max) per channel.
+    update_block() returns an array with shape (samples, 2) or (samples, channels, 2).'''
+
+    def __init__(self, n: int) -> None:
+        super().__init__()
+        if n < 1:
+            raise Exception('ERROR in cpg_scpi: The window size must be at least 1.')
+        self.n = n
+
+    def _newState(self):
+        # sample counter, ascending deque of (index, value) for the minimum, descending deque for the maximum,
+        # and the last n values for the block update:
+        return [0, collections.deque(), collections.deque(), collections.deque(maxlen=self.n)]
+
+    def _step(self, state, x: float):
+        index = state[0]
+        state[0] += 1
+        for queue, worse in ((state[1], lambda a, b: a >= b), (state[2], lambda a, b: a <= b)):
+            while queue and worse(queue[-1][1], x):
+                queue.pop()
+            queue.append((index, x))
+            if queue[0][0] <= index - self.n:
+                queue.popleft()
+        state[3].append(x)
+        return state[1][0][1], state[2][0][1]
+
+    def _stepBlock(self, state, column, np):
+        previous = np.array(state[3], dtype=np.float64)
+        history = previous[max(0, len(previous) - (self.n - 1)):] # the last n - 1 values
+        values = np.concatenate((history, column))
+        result = np.stack((self._rolling(values, len(history), np.minimum, np.inf, np),
+                           self._rolling(values, len(history), np.maximum, -np.inf, np)), axis=1)
+        # Continue the O(1) state with the last n samples:
+        last = np.concatenate((previous, column))[-self.n:].tolist() # also for blocks shorter than n
+        start = state[0] + len(column) - len(last)
+        state[:] = [start, collections.deque(), collections.deque(), collections.deque(maxlen=self.n)]
+        for x in last:
+            self._step(state, x)
+        return result
+
+    def _rolling(self, values, historyLength: int, op, neutral: float, np):
+        '''Return op over the windows of the last n values ending at each value after the history, with O(1) work
+        per value (van Herk/Gil-Werman): the values are split into segments of n, and each window is combined from the
+        suffix of one segment and the prefix of the next one.'''
+        n = self.n
+        padding = n - 1 - historyLength # while the first n samples arrive
+        length = padding + len(values)
+        segments = np.full(-(-length // n) * n, neutral)
+        segments[padding:length] = values
+        segments = segments.reshape(-1, n)
+        prefix = op.accumulate(segments, axis=1).ravel()
+        suffix = op.accumulate(segments[:, ::-1], axis=1)[:, ::-1].ravel()
+        starts = np.arange(length - (n - 1))
+        return op(suffix[starts], prefix[starts + n - 1])
+
+
+class Chain(Filter):
+    '''Apply several filters one after the other.'''
+
+    def __init__(self, *filters: Sequence[Filter]) -> None:
+        super().__init__()
+        self.filters = filters
+
+    def reset(self) -> None:
+        for f in self.filters:
+            f.reset()
+
+    def update(self, value):
+        for f in self.filters:
+            value = f.update(value)
+        return value
+
+    def update_block(self, values):
+        for f in self.filters:
+            values = f.update_block(values)
+        return values
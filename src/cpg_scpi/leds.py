@@ -0,0 +1,135 @@
+'''Write-behind LED output
+
+LedChannel sends LED values to the CPG in a background thread, such that measurements are not blocked by LED
+updates. Only the latest value is sent: values which are superseded before they were sent are dropped.
+Animations are played with precise frame timing on absolute deadlines, frames are skipped if the CPG cannot
+keep up. Use it via CircuitPlayground.led(value, wait=False) and CircuitPlayground.led_sequence():
+
+    frames = [1 << i for i in range(10)] + [1 << i for i in range(9, -1, -1)]
+    cpg.led_sequence(frames, fps=30, repeat=10, wait=False)   # plays in the background
+    while cpg.led_channel.busy:
+        print(cpg.acc())                                      # measure at full speed meanwhile
+'''
+
+import math
+import threading
+import time
+from typing import Iterable
+
+
+class LedChannel:
+    '''Background sender of LED values with latest-wins coalescing. Created by CircuitPlayground.led_channel.'''
+
+    def __init__(self, cpg) -> None:
+        self.cpg = cpg
+        self.sent = 0       # values sent to the CPG
+        self.coalesced = 0  # values dropped because a newer value arrived before they were sent
+        self.skipped = 0    # frames of sequences dropped to keep the frame timing
+        self._cond = threading.Condition()
+        self._pending = None  # latest value, not sent yet
+        self._frames = None   # sequence to play: (frames, fps)
+        self._busy = False    # the worker is sending
+        self._closed = False
+        self._error = None
+        self._thread = threading.Thread(target=self._worker, name='cpg_scpi-leds', daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        '''Return True while a value or a sequence is waiting to be sent or being sent.'''
+        return self._pending is not None or self._frames is not None or self._busy
+
+    def set(self, value: int) -> None:
+        '''Queue value for sending and return immediately. A playing sequence is stopped.'''
+        with self._cond:
+            self._checkError()
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = int(value)
+            self._frames = None
+            self._cond.notify_all()
+
+    def play(self, frames: Iterable[int], fps: float, repeat: int = 1) -> None:
+        '''Queue a sequence of LED values for playing with fps frames per second and return immediately.'''
+        if fps <= 0:
+            raise Exception('ERROR in cpg_scpi: fps must be positive.')
+        frames = [int(frame) for frame in frames] * repeat
+        with self._cond:
+            self._checkError()
+            self._pending = None
+            self._frames = (frames, fps)
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        '''Wait until all queued values and sequences are sent.'''
+        with self._cond:
+            while self.busy and self._error is None:
+                self._cond.wait()
+            self._checkError()
+
+    def close(self) -> None:
+        '''Send the queued values and stop the background thread.'''
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._checkError()
+
+    def _checkError(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _worker(self) -> None:
+        with self._cond:
+            while True:
+                while self._pending is None and self._frames is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is not None:
+                    value, self._pending = self._pending, None
+                    self._send(value)
+                elif self._frames is not None:
+                    self._play(*self._frames)
+                elif self._closed:
+                    return
+                self._cond.notify_all() # for flush()
+
+    def _send(self, value: int) -> None:
+        '''Send value without holding the condition, such that set() does not wait for the com port.'''
+        self._busy = True
+        self._cond.release()
+        try:
+            self.cpg._send(f'OUT:LED {value}')
+            self.sent += 1
+        except Exception as e:
+            self._error = e
+        finally:
+            self._cond.acquire()
+            self._busy = False
+
+    def _play(self, frames: list, fps: float) -> None:
+        sequence = self._frames
+        start = time.monotonic()
+        index = 0
+        while index < len(frames):
+            self._send(frames[index])
+            if self._error is not None:
+                self._frames = None
+                return
+            if self._frames is not sequence:
+                return # replaced by set() or play()
+            # Next frame on an absolute deadline, skip frames if sending took too long:
+            nextIndex = max(index + 1, math.floor((time.monotonic() - start) * fps) + 1)
+            self.skipped += min(nextIndex, len(frames)) - index - 1
+            index = nextIndex
+            deadline = start + index / fps
+            while self._frames is sequence and not self._closed:
+                delay = deadline - time.monotonic()
+                if delay <= 0:
+                    break
+                self._cond.wait(delay)
+            if self._frames is not sequence:
+                return
+            if self._closed:
+                break
+        self._frames = None
@@ -0,0 +1,246 @@
+'''Metrics for CPG SCPI
+
+Opt-in instrumentation of a CircuitPlayground. Once enabled, every command sent via the query methods is counted
+with its latency, bytes written and read, read timeouts, CPG-ERROR responses and UNEXPECTED RESPONSE exceptions.
+Commands are keyed by their header without parameters, e.g. "OUT:LED" for "OUT:LED 5", to keep the number of
+label values bounded. When metrics are disabled (the default), nothing is added to the query path.
+
+    cpg = cpg_scpi.CircuitPlayground()
+    metrics = cpg.enable_metrics()
+    ...
+    print(cpg.stats()['MEAS:ACC?'])
+    metrics.writeText('cpg.prom')         # text format for file based collectors
+    server = metrics.serve(9464)          # or scrape http://127.0.0.1:9464/metrics
+
+The text format is the Prometheus exposition format.
+'''
+
+import threading
+import time
+from typing import Callable, Dict, List
+
+# Upper bounds of the latency histogram buckets in seconds, the last bucket is unbounded:
+LATENCY_BUCKETS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+
+
+class _MeteredTransport:
+    '''Wraps the transport of a CircuitPlayground and counts bytes and read timeouts.'''
+
+    def __init__(self, transport) -> None:
+        self._transport = transport
+        self._bytesWritten = 0
+        self._bytesRead = 0
+        self._timeouts = 0
+
+    def write(self, data: bytes) -> int:
+        self._bytesWritten += len(data)
+        return self._transport.write(data)
+
+    def readline(self) -> bytes:
+        data = self._transport.readline()
+        self._bytesRead += len(data)
+        if not data.endswith(b'\n'):
+            self._timeouts += 1
+        return data
+
+    def read(self, size: int = 1) -> bytes:
+        data = self._transport.read(size)
+        self._bytesRead += len(data)
+        if len(data) < size:
+            self._timeouts += 1
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._transport, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._transport, name, value)
+
+
+class CommandStats:
+    '''Counters of a single SCPI command.'''
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.bytesWritten = 0
+        self.bytesRead = 0
+        self.timeouts = 0
+        self.cpgErrors = 0
+        self.unexpected = 0
+        self.otherErrors = 0
+        self.latencySum = 0.0
+        self.latencyMax = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def asDict(self) -> dict:
+        return {
+            'count': self.count,
+            'bytes_written': self.bytesWritten,
+            'bytes_read': self.bytesRead,
+            'timeouts': self.timeouts,
+            'cpg_errors': self.cpgErrors,
+            'unexpected_responses': self.unexpected,
+            'other_errors': self.otherErrors,
+            'latency_mean_s': self.latencySum / self.count if self.count else None,
+            'latency_max_s': self.latencyMax,
+            'latency_buckets': dict(zip(LATENCY_BUCKETS + (float('inf'),), self.buckets)),
+        }
+
+
+class Metrics:
+    '''Collects CommandStats per SCPI command. Created by CircuitPlayground.enable_metrics().'''
+
+    def __init__(self, callback: Callable = None) -> None:
+        '''callback is called after each command as callback(cmd, latency, bytesWritten, bytesRead, error)
+        with latency in seconds and error None or the raised exception.'''
+        self.commands: Dict[str, CommandStats] = {}
+        self.callbacks: List[Callable] = [] if callback is None else [callback]
+        self.transport: _MeteredTransport = None
+        self._lock = threading.Lock()
+
+    def record(self, cmd: str, latency: float, bytesWritten: int, bytesRead: int, timeouts: int, error: Exception = None) -> None:
+        '''Add one executed command to the statistics.'''
+        with self._lock:
+            stats = self.commands.get(cmd)
+            if stats is None:
+                stats = self.commands[cmd] = CommandStats()
+            stats.count += 1
+            stats.bytesWritten += bytesWritten
+            stats.bytesRead += bytesRead
+            stats.timeouts += timeouts
+            stats.latencySum += latency
+            stats.latencyMax = max(stats.latencyMax, latency)
+            index = 0
+            while index < len(LATENCY_BUCKETS) and latency > LATENCY_BUCKETS[index]:
+                index += 1
+            stats.buckets[index] += 1
+            if error is not None:
+                message = str(error)
+                if message.startswith('CPG-ERROR'):
+                    stats.cpgErrors += 1
+                elif 'UNEXPECTED RESPONSE' in message:
+                    stats.unexpected += 1
+                else:
+                    stats.otherErrors += 1
+        for callback in self.callbacks:
+            callback(cmd, latency, bytesWritten, bytesRead, error)
+
+    def snapshot(self) -> dict:
+        '''Return a dict {cmd: counters} plus the totals of the transport under the key None.'''
+        with self._lock:
+            result = {cmd: stats.asDict() for cmd, stats in self.commands.items()}
+        if self.transport is not None:
+            # Totals include traffic outside of queries, e.g. streaming and LED writes:
+            result[None] = {
+                'bytes_written': self.transport._bytesWritten,
+                'bytes_read': self.transport._bytesRead,
+                'timeouts': self.transport._timeouts,
+            }
+        return result
+
+    def toText(self) -> str:
+        '''Return all metrics in the Prometheus text exposition format.'''
+        def label(cmd: str) -> str:
+            return '{command="' + cmd.replace('\\', '\\\\').replace('"', '\\"') + '"'
+        snapshot = self.snapshot()
+        totals = snapshot.pop(None, None)
+        lines = []
+        counters = (
+            ('cpg_scpi_commands_total', 'count', 'Number of commands sent.'),
+            ('cpg_scpi_command_bytes_written_total', 'bytes_written', 'Bytes written for the command.'),
+            ('cpg_scpi_command_bytes_read_total', 'bytes_read', 'Bytes read for the command.'),
+            ('cpg_scpi_command_timeouts_total', 'timeouts', 'Reads which ended with a timeout.'),
+            ('cpg_scpi_command_cpg_errors_total', 'cpg_errors', 'CPG-ERROR responses.'),
+            ('cpg_scpi_command_unexpected_responses_total', 'unexpected_responses', 'UNEXPECTED RESPONSE exceptions.'),
+            ('cpg_scpi_command_other_errors_total', 'other_errors', 'Other exceptions.'),
+        )
+        for name, key, help in counters:
+            lines.append(f'# HELP {name} {help}')
+            lines.append(f'# TYPE {name} counter')
+            for cmd, stats in snapshot.items():
+                lines.append(f'{name}{label(cmd)}}} {stats[key]}')
+        name = 'cpg_scpi_command_latency_seconds'
+        lines.append(f'# HELP {name} Latency of the command including the response.')
+        lines.append(f'# TYPE {name} histogram')
+        for cmd, stats in snapshot.items():
+            cumulative = 0
+            for bound, count in stats['latency_buckets'].items():
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{name}_bucket{label(cmd)},le="{le}"}} {cumulative}')
+            lines.append(f'{name}_sum{label(cmd)}}} {(stats["latency_mean_s"] or 0.0) * stats["count"]}')
+            lines.append(f'{name}_count{label(cmd)}}} {stats["count"]}')
+        if totals is not None:
+            for key in ('bytes_written', 'bytes_read', 'timeouts'):
+                name = f'cpg_scpi_transport_{key}_total'
+                lines.append(f'# TYPE {name} counter')
+                lines.append(f'{name} {totals[key]}')
+        return '\n'.join(lines) + '\n'
+
+    def writeText(self, path: str) -> None:
+        '''Write toText() to path. The file is replaced atomically, such that collectors never read a partial file.'''
+        import os
+        tmpPath = path + '.tmp'
+        with open(tmpPath, 'w') as f:
+            f.write(self.toText())
+        os.replace(tmpPath, path)
+
+    def serve(self, port: int = 9464, host: str = '127.0.0.1'):
+        '''Serve toText() via HTTP on host:port in a background thread. Call shutdown() on the returned server to stop it.'''
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.toText().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass # do not print each request
+
+        server = HTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name='cpg_scpi-metrics', daemon=True).start()
+        return server
+
+
+def commandHeader(cmd: str) -> str:
+    '''Return the SCPI command without its parameters, e.g. "OUT:LED" for "OUT:LED 5".'''
+    return cmd.split(' ', 1)[0]
+
+
+def meter(method, metrics: Metrics, transport: _MeteredTransport, lock, commands: Callable):
+    '''Return a wrapper of the bound query method which records each call in metrics. commands(args) returns the list
+    of commands sent by the call. The call is timed while holding lock, i.e. without the time waiting for other threads.
+    A batch of several commands is recorded per command: each gets the latency of the whole batch, its own request bytes
+    and an equal share of the response bytes, while timeouts and an error are recorded once, on the first command.'''
+    def metered(*args):
+        with lock:
+            bytesWritten, bytesRead, timeouts = transport._bytesWritten, transport._bytesRead, transport._timeouts
+            start = time.perf_counter()
+            error = None
+            try:
+                return method(*args)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                latency = time.perf_counter() - start
+                cmds = commands(args)
+                bytesWritten = transport._bytesWritten - bytesWritten
+                bytesRead = transport._bytesRead - bytesRead
+                timeouts = transport._timeouts - timeouts
+                if len(cmds) == 1:
+                    metrics.record(commandHeader(cmds[0]), latency, bytesWritten, bytesRead, timeouts, error)
+                else:
+                    for i, cmd in enumerate(cmds):
+                        written = len(cmd) + 1 # the request ends with a newline
+                        metrics.record(commandHeader(cmd), latency, written, bytesRead // len(cmds),
+                                       timeouts if i == 0 else 0, error if i == 0 else None)
+    return metered
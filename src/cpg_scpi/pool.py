@@ -0,0 +1,106 @@
+'''Pool of several Circuit Playgrounds or BBC micro:bits
+
+CircuitPlaygroundPool connects to every board found on the serial ports and polls them concurrently,
+with one worker thread per board. Results are keyed by the USB serial number of each board and carry
+a host timestamp, such that the values of all boards can be aligned.
+
+Example:
+
+    from cpg_scpi.pool import CircuitPlaygroundPool
+
+    with CircuitPlaygroundPool() as pool:
+        for i in range(100):
+            for serialNumber, (hostTime, values) in pool.poll(['acc', 'temp']).items():
+                print(serialNumber, hostTime, values)
+'''
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Union
+
+from . import CircuitPlayground, _findBoards
+
+
+class CircuitPlaygroundPool:
+    '''Class to communicate with several Circuit Playgrounds or BBC micro:bits in parallel'''
+
+    def __init__(self, comports: List[str] = None, baudrate = 115200, queryPolicy = 'deferred') -> None:
+        '''Connect to all boards found on the serial ports, or to the given list of com ports.
+        The boards are identified by their USB serial number, or by their com port if the serial number is unknown.'''
+        if comports is None:
+            cpgFound, bbcFound = _findBoards()
+            ports = [(port.serial_number or port.device, port.device, port.serial_number) for port in cpgFound + bbcFound]
+        else:
+            ports = [(comport, comport, None) for comport in comports]
+        if len(ports) == 0:
+            raise Exception('ERROR in cpg_scpi: Could not find any serial port for Adafruit Circuit Playground or BBC micro:bit.')
+        print(f'INFO in cpg_scpi: Connecting to {len(ports)} boards ...')
+        self.devices: Dict[str, CircuitPlayground] = {}
+        try:
+            for key, comport, serialNumber in ports:
+                self.devices[key] = CircuitPlayground(comport, baudrate, queryPolicy, portCache=False)
+                self.devices[key].serialNumber = serialNumber
+        except Exception:
+            self.close()
+            raise
+        self._executor = ThreadPoolExecutor(max_workers=len(self.devices), thread_name_prefix='cpg_scpi-pool')
+
+    def __enter__(self) -> 'CircuitPlaygroundPool':
+        return self
+
+    def __exit__(self, *excInfo) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+    def __getitem__(self, serialNumber: str) -> CircuitPlayground:
+        return self.devices[serialNumber]
+
+    def close(self) -> None:
+        '''Close the com port connections of all boards.'''
+        if getattr(self, '_executor', None) is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for device in self.devices.values():
+            device.close()
+
+    def poll(self, what: Union[str, List[str]] = 'acc') -> Dict[str, Tuple[float, object]]:
+        '''Measure on all boards in parallel and return a dict {serialNumber: (hostTime, value)}.
+        what is either the name of a reader method, e.g. 'acc' or 'temp_wts',
+        or a list of names for CircuitPlayground.snapshot(), which then returns a dict as value.
+        hostTime is the time.monotonic() value in the middle between sending the query and receiving the response.'''
+        if isinstance(what, str):
+            job = lambda device: getattr(device, what)()
+        else:
+            job = lambda device: device.snapshot(what)
+        futures = {serialNumber: self._executor.submit(self._timed, job, device) for serialNumber, device in self.devices.items()}
+        # Wait for all boards, even if one of them fails:
+        results = {}
+        error = None
+        for serialNumber, future in futures.items():
+            try:
+                results[serialNumber] = future.result()
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+        return results
+
+    def run(self, what: Union[str, List[str]] = 'acc', interval: float = 0, count: int = -1) -> Iterator[Dict[str, Tuple[float, object]]]:
+        '''Call poll() count times (endless for -1) with interval seconds between the starts of two polls and yield the results.'''
+        nextTime = time.monotonic()
+        i = 0
+        while count < 0 or i < count:
+            yield self.poll(what)
+            i += 1
+            nextTime += interval
+            delay = nextTime - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    @staticmethod
+    def _timed(job, device) -> Tuple[float, object]:
+        sendTime = time.monotonic()
+        value = job(device)
+        return (sendTime + time.monotonic()) / 2, value
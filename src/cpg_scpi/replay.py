@@ -0,0 +1,163 @@
+'''Recording and replay of CPG sessions
+
+SessionRecorder wraps the transport of a CircuitPlayground and writes every command sent and every response
+received, with host timestamps, into a compact binary file. ReplayDevice plays such a file back as a transport,
+either in real time or as fast as possible, so the unchanged application code runs on recorded field data:
+
+    cpg = cpg_scpi.CircuitPlayground()
+    cpg.start_recording('session.cpgrec')
+    ...                                   # measure as usual
+    cpg.stop_recording()
+
+    from cpg_scpi.replay import ReplayDevice
+    cpg = cpg_scpi.CircuitPlayground(ReplayDevice('session.cpgrec'), lazyConnect=True)
+    ...                                   # the same sequence of calls returns the recorded values
+
+The replay expects the same sequence of commands as in the recording and raises an exception if they differ.
+
+File format: the header b'CPGREC1\\n' followed by records, each with a little endian header
+(float64 host time in seconds since start of recording, uint8 direction 0=write 1=read, uint32 length) and the raw bytes.
+'''
+
+import collections
+import struct
+import threading
+import time
+from typing import Iterator
+
+from .virtual import _Receiver
+
+_MAGIC = b'CPGREC1\n'
+_RECORD = struct.Struct('<dBI')
+_WRITE = 0
+_READ = 1
+
+
+class SessionRecorder:
+    '''Transport wrapper which records all traffic of the wrapped transport into a file.'''
+
+    def __init__(self, transport, path: str) -> None:
+        self._transport = transport
+        self._file = open(path, 'xb') # never overwrite an earlier recording
+        self._file.write(_MAGIC)
+        self._lock = threading.Lock()
+        self._startTime = time.monotonic()
+
+    def write(self, data: bytes) -> int:
+        self._record(_WRITE, data)
+        return self._transport.write(data)
+
+    def readline(self) -> bytes:
+        data = self._transport.readline()
+        self._record(_READ, data)
+        return data
+
+    def read(self, size: int = 1) -> bytes:
+        data = self._transport.read(size)
+        self._record(_READ, data)
+        return data
+
+    def stop(self):
+        '''Close the recording file and return the wrapped transport.'''
+        with self._lock:
+            self._file.close()
+        return self._transport
+
+    def close(self) -> None:
+        self.stop()
+        self._transport.close()
+
+    def __getattr__(self, name):
+        return getattr(self._transport, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._transport, name, value)
+
+    def _record(self, direction: int, data: bytes) -> None:
+        if len(data) == 0:
+            return # nothing received before the timeout
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(_RECORD.pack(time.monotonic() - self._startTime, direction, len(data)))
+                self._file.write(data)
+
+
+def readRecording(path: str) -> Iterator[tuple]:
+    '''Yield the records of a recording as (hostTime, direction, data) with direction 0=write 1=read.
+    The file is read record by record, so long recordings are not loaded into memory.'''
+    with open(path, 'rb') as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise Exception(f'ERROR in cpg_scpi: "{path}" is not a cpg_scpi recording.')
+        while True:
+            header = f.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return # end of the recording
+            hostTime, direction, length = _RECORD.unpack(header)
+            yield hostTime, direction, f.read(length)
+
+
+class ReplayDevice(_Receiver):
+    '''Transport which replays a recorded session. speed=None replays as fast as possible, speed=1.0 in real time.'''
+
+    def __init__(self, path: str, speed: float = None) -> None:
+        self.name = f'REPLAY {path}'
+        self.baudrate = 115200
+        self.timeout = 5 # timeout is for reads
+        self.is_open = True
+        self.speed = speed
+        self._recording = readRecording(path)
+        self._records = collections.deque() # records read ahead from the recording, see _peek()
+        self._peek() # fail early if path is not a recording
+        self._lock = threading.Condition()
+        self._rxBuffer = bytearray()
+        self._pending = collections.deque() # responses which are not due yet: (dueTime, data)
+        self._expectedWrite = b''
+
+    # Interface of serial.Serial:
+
+    def write(self, data: bytes) -> int:
+        with self._lock:
+            self._expectedWrite += data
+            # Recorded writes may be split differently, so compare the concatenated bytes:
+            while self._expectedWrite:
+                if self._peek() is None or self._records[0][1] != _WRITE:
+                    raise Exception(f'ERROR in cpg_scpi: Replay differs from recording, unexpected command "{self._expectedWrite.decode("utf-8").strip()}".')
+                recorded = self._records[0][2]
+                common = min(len(recorded), len(self._expectedWrite))
+                if recorded[:common] != self._expectedWrite[:common]:
+                    raise Exception(f'ERROR in cpg_scpi: Replay differs from recording, expected "{recorded.decode("utf-8").strip()}", '
+                                    f'got "{self._expectedWrite.decode("utf-8").strip()}".')
+                if common < len(recorded):
+                    self._records[0] = (self._records[0][0], _WRITE, recorded[common:])
+                    self._expectedWrite = b''
+                    break
+                writeTime = self._records.popleft()[0]
+                self._expectedWrite = self._expectedWrite[common:]
+                self._scheduleResponses(writeTime)
+            self._lock.notify_all()
+        return len(data)
+
+    def close(self) -> None:
+        self.is_open = False
+        with self._lock:
+            self._recording.close()
+
+    def _scheduleResponses(self, writeTime: float) -> None:
+        '''Make the recorded responses following a write available, delayed like in the recording if speed is set.'''
+        now = time.monotonic()
+        while self._peek() is not None and self._records[0][1] == _READ:
+            hostTime, direction, data = self._records.popleft()
+            dueTime = now if self.speed is None else now + (hostTime - writeTime) / self.speed
+            self._pending.append((dueTime, data))
+
+    def _peek(self) -> tuple:
+        '''Return the next record without consuming it, None at the end of the recording.'''
+        if not self._records:
+            record = next(self._recording, None)
+            if record is None:
+                return None
+            self._records.append(record)
+        return self._records[0]
@@ -0,0 +1,115 @@
+'''Drift-free multi-rate sampling
+
+Sampler measures each sensor at its own rate on absolute time.monotonic() deadlines, such that neither the
+round trip time nor the processing time adds up over time. Sensors which are due at the same time are measured
+together with a single snapshot() round trip. Use it via CircuitPlayground.sample():
+
+    result = cpg.sample({'acc': 100, 'temp': 1, 'light': 10}, duration=60)
+    for hostTime, (x, y, z) in result.samples['acc']:
+        ...
+    print(result.report())
+'''
+
+import math
+import time
+from typing import Callable, Dict, List, Tuple
+
+
+class _Schedule:
+    '''Deadlines and timing statistics of a single sensor.'''
+
+    def __init__(self, name: str, rate: float, start: float) -> None:
+        if rate <= 0:
+            raise Exception(f'ERROR in cpg_scpi: The rate of "{name}" must be positive.')
+        self.name = name
+        self.rate = rate
+        self.period = 1 / rate
+        self.start = start
+        self.index = 0          # number of the next deadline
+        self.deadline = start   # start + index * period, never accumulated
+        self.count = 0
+        self.missed = 0         # deadlines skipped because the previous exchange took too long
+        self.latenessSum = 0.0
+        self.latenessSquareSum = 0.0
+        self.latenessMax = 0.0
+
+    def done(self, sendTime: float) -> None:
+        '''Record a measurement sent at sendTime and move to the next deadline in the future.'''
+        lateness = sendTime - self.deadline
+        self.count += 1
+        self.latenessSum += lateness
+        self.latenessSquareSum += lateness * lateness
+        self.latenessMax = max(self.latenessMax, lateness)
+        nextIndex = max(self.index + 1, math.floor((sendTime - self.start) / self.period) + 1)
+        self.missed += nextIndex - self.index - 1
+        self.index = nextIndex
+        self.deadline = self.start + self.index * self.period
+
+
+class Sampler:
+    '''Multi-rate sampling scheduler of a CircuitPlayground. Created and run by CircuitPlayground.sample().'''
+
+    def __init__(self, cpg, rates: Dict[str, float], coalesce_ms: float = 1.0) -> None:
+        '''rates maps snapshot() names, e.g. 'acc' or 'temp_wts', to sample rates in Hz.
+        Sensors due within coalesce_ms milli-seconds of each other are measured in the same round trip.'''
+        if not rates:
+            raise Exception('ERROR in cpg_scpi: No sensors to sample.')
+        self.cpg = cpg
+        self.rates = dict(rates)
+        self.coalesce = coalesce_ms / 1000
+        self.samples: Dict[str, List[Tuple[float, object]]] = {name: [] for name in rates}
+        self.exchanges = 0
+        self.elapsed = 0.0
+        self._schedules = []
+
+    def run(self, duration: float = None, callback: Callable = None) -> 'Sampler':
+        '''Sample for duration seconds. callback(hostTime, values) is called after each round trip with a dict of
+        the values measured in it. Sampling stops early if callback returns False, and never stops for duration=None
+        unless callback does so. Samples are only kept in self.samples if no callback is given.
+        hostTime is the time.monotonic() value in the middle between sending the query and receiving the response.'''
+        start = time.monotonic()
+        self._schedules = [_Schedule(name, rate, start) for name, rate in self.rates.items()]
+        span = None # the scheduled time span, if sampling was not stopped by callback
+        while True:
+            nextDeadline = min(schedule.deadline for schedule in self._schedules)
+            if duration is not None and nextDeadline - start >= duration:
+                span = duration
+                break
+            delay = nextDeadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            sendTime = time.monotonic()
+            due = [schedule for schedule in self._schedules if schedule.deadline <= sendTime + self.coalesce]
+            values = self.cpg.snapshot([schedule.name for schedule in due])
+            hostTime = (sendTime + time.monotonic()) / 2
+            self.exchanges += 1
+            for schedule in due:
+                schedule.done(sendTime)
+            if callback is not None:
+                if callback(hostTime, values) is False:
+                    break
+            else:
+                for name, value in values.items():
+                    self.samples[name].append((hostTime, value))
+        # The rates are relative to the whole duration, not only up to the last round trip:
+        self.elapsed = time.monotonic() - start if span is None else max(span, time.monotonic() - start)
+        return self
+
+    def report(self) -> Dict[str, dict]:
+        '''Return per sensor the requested and achieved rate in Hz, the number of samples and missed deadlines,
+        and the mean, standard deviation (jitter) and maximum of the lateness of the queries in milli-seconds.'''
+        report = {}
+        for schedule in self._schedules:
+            n = max(1, schedule.count)
+            mean = schedule.latenessSum / n
+            variance = max(0.0, schedule.latenessSquareSum / n - mean * mean)
+            report[schedule.name] = {
+                'rate_hz': schedule.rate,
+                'achieved_hz': schedule.count / self.elapsed if self.elapsed > 0 else 0.0,
+                'samples': schedule.count,
+                'missed': schedule.missed,
+                'lateness_mean_ms': mean * 1000,
+                'jitter_ms': math.sqrt(variance) * 1000,
+                'lateness_max_ms': schedule.latenessMax * 1000,
+            }
+        return report
@@ -0,0 +1,394 @@
+'''Local daemon to share one board between several processes
+
+A serial port can only be opened by one process. The daemon owns the port and serves the reader API of
+CircuitPlayground to any number of local processes via a Unix domain socket:
+
+    python -m cpg_scpi serve                       # in one terminal, or as a service
+    python -m cpg_scpi serve --port COM9 --socket /tmp/cpg.sock
+
+    from cpg_scpi.server import CircuitPlaygroundClient
+    cpg = CircuitPlaygroundClient()                # in any number of processes
+    print(cpg.acc())
+    cpg.start_stream('MEAS:ACC?', 10)
+    samples = cpg.read_stream()
+
+Identical queries of several clients which are waiting at the same time are sent to the board only once and
+the response is passed to all of them. A stream is started once and its samples are passed to all clients
+which subscribed to it.
+
+The daemon and its clients need Unix domain sockets, which Python does not provide on Windows.
+
+Protocol: one JSON object per line. Requests {"id": 1, "method": "acc", "args": []} are answered with
+{"id": 1, "result": ...} or {"id": 1, "error": "..."}. Stream samples are pushed as {"stream": cmd, "samples": [...]}.
+'''
+
+import argparse
+import collections
+import json
+import os
+import queue
+import select
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from typing import List
+
+from . import CircuitPlayground, _MEASUREMENTS
+
+# Methods without side effects. Identical concurrent calls are coalesced into one round trip.
+QUERIES = (('idn', 'config', 'snapshot')
+           + tuple(measurement.name for measurement in _MEASUREMENTS)
+           + tuple(measurement.name + '_wts' for measurement in _MEASUREMENTS if measurement.count > 0)
+           + tuple(measurement.name + '_block' for measurement in _MEASUREMENTS if measurement.count > 0))
+# Methods which are executed for every call:
+COMMANDS = ('led', 'ledDemo')
+
+
+def defaultSocketPath() -> str:
+    '''Return the default path of the Unix socket, in XDG_RUNTIME_DIR if set, otherwise in the temp directory.'''
+    directory = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(directory, f'cpg_scpi-{user}.sock')
+
+
+def _toJson(value):
+    '''Convert numpy arrays of the block methods into nested lists, also in tuples like the result of capSense_block().'''
+    if isinstance(value, tuple):
+        return [_toJson(item) for item in value]
+    return value.tolist() if hasattr(value, 'tolist') else value
+
+
+def _fromJson(value):
+    '''Convert JSON lists back into the tuples returned by CircuitPlayground.'''
+    if isinstance(value, list):
+        return tuple(_fromJson(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _fromJson(item) for key, item in value.items()}
+    return value
+
+
+class _Job:
+    def __init__(self, method: str, args: list) -> None:
+        self.method = method
+        self.args = args
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class _Connection:
+    '''A client connection of the daemon, with a lock such that responses and stream data are not interleaved.'''
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.lock = threading.Lock()
+
+    def send(self, message: dict) -> None:
+        data = (json.dumps(message) + '\n').encode('utf-8')
+        with self.lock:
+            self.sock.sendall(data)
+
+
+class Daemon:
+    '''Owns a CircuitPlayground and executes the calls of all clients in a single worker thread.'''
+
+    STREAM_POLL_INTERVAL = 0.02 # seconds between two fan outs of stream samples
+
+    def __init__(self, cpg: CircuitPlayground) -> None:
+        self.cpg = cpg
+        self.calls = 0
+        self.coalesced = 0
+        self._jobs = queue.Queue()
+        self._queued = {} # (method, args) -> queued _Job of a query, to coalesce identical queries
+        self._lock = threading.Lock()
+        self._stream = None # (cmd, interval_ms) of the running stream
+        self._subscribers: List[_Connection] = []
+        self._running = True
+        threading.Thread(target=self._worker, name='cpg_scpi-daemon', daemon=True).start()
+        threading.Thread(target=self._fanOut, name='cpg_scpi-fanout', daemon=True).start()
+
+    def call(self, method: str, args: list, connection: _Connection = None):
+        '''Execute a call of a client in the worker thread and return its result.'''
+        if method == 'start_stream':
+            return self._subscribe(connection, *args)
+        if method == 'stop_stream':
+            return self._unsubscribe(connection)
+        if method not in QUERIES and method not in COMMANDS:
+            raise Exception(f'ERROR in cpg_scpi: "{method}" is not available via the daemon.')
+        key = (method, json.dumps(args)) if method in QUERIES else None
+        with self._lock:
+            self.calls += 1
+            job = self._queued.get(key) if key is not None else None
+            if job is None:
+                job = _Job(method, args)
+                if key is not None:
+                    self._queued[key] = job
+                self._jobs.put(job)
+            else:
+                self.coalesced += 1
+        return self._wait(job)
+
+    def disconnect(self, connection: _Connection) -> None:
+        if connection in self._subscribers:
+            self._unsubscribe(connection)
+
+    def close(self) -> None:
+        self._running = False
+        self._run(lambda: None) # wait for the worker to finish the queued jobs
+        self._jobs.put(None)
+        self.cpg.close()
+
+    def _wait(self, job: _Job):
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _run(self, function):
+        '''Execute function() in the worker thread and return its result.'''
+        job = _Job(function, None)
+        self._jobs.put(job)
+        return self._wait(job)
+
+    def _worker(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            if job.args is None:
+                function = job.method
+            else:
+                with self._lock:
+                    # From now on, identical queries must wait for a new measurement:
+                    self._queued.pop((job.method, json.dumps(job.args)), None)
+                function = lambda: _toJson(getattr(self.cpg, job.method)(*job.args))
+            try:
+                job.result = function()
+            except Exception as e:
+                job.error = e
+            job.done.set()
+
+    def _subscribe(self, connection: _Connection, cmd: str = 'MEAS:ACC?', interval_ms: int = 10) -> None:
+        with self._lock:
+            if self._stream is not None and self._stream != (cmd, interval_ms):
+                raise Exception(f'ERROR in cpg_scpi: The daemon already streams "{self._stream[0]}" every {self._stream[1]} ms.')
+            if connection not in self._subscribers:
+                self._subscribers.append(connection)
+            if self._stream is not None:
+                return
+            self._stream = (cmd, interval_ms)
+        try:
+            self._run(lambda: self.cpg.start_stream(cmd, interval_ms))
+        except Exception:
+            with self._lock:
+                self._stream = None
+                self._subscribers.clear()
+            raise
+
+    def _unsubscribe(self, connection: _Connection) -> None:
+        with self._lock:
+            if connection in self._subscribers:
+                self._subscribers.remove(connection)
+            if self._subscribers or self._stream is None:
+                return
+            self._stream = None
+        self._run(self.cpg.stop_stream)
+
+    def _fanOut(self) -> None:
+        '''Pass the samples of a running stream to all subscribers.'''
+        while self._running:
+            time.sleep(self.STREAM_POLL_INTERVAL)
+            with self._lock:
+                stream, subscribers = self._stream, list(self._subscribers)
+            if stream is None: # samples of a stream which has ended are still fanned out
+                continue
+            try:
+                message = {'stream': stream[0], 'samples': self.cpg.read_stream()}
+            except Exception as e:
+                message = {'stream': stream[0], 'error': str(e)}
+            if 'samples' in message and not message['samples']:
+                continue
+            for connection in subscribers:
+                try:
+                    connection.send(message)
+                except OSError:
+                    self.disconnect(connection)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        daemon: Daemon = self.server.cpgDaemon
+        connection = _Connection(self.request)
+        try:
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict) or 'id' not in request or 'method' not in request:
+                        raise ValueError('requests need an "id" and a "method"')
+                except ValueError as e: # also json.JSONDecodeError
+                    connection.send({'id': None, 'error': f'ERROR in cpg_scpi: Malformed request: {e}'})
+                    continue
+                try:
+                    response = {'id': request['id'], 'result': daemon.call(request['method'], request.get('args', []), connection)}
+                except Exception as e:
+                    response = {'id': request['id'], 'error': str(e)}
+                connection.send(response)
+        except OSError:
+            pass # client disconnected
+        finally:
+            daemon.disconnect(connection)
+
+
+if hasattr(socket, 'AF_UNIX'):
+    class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+else: # e.g. Windows
+    _Server = None
+
+
+def _checkUnixSockets() -> None:
+    if not hasattr(socket, 'AF_UNIX'):
+        raise Exception('ERROR in cpg_scpi: The daemon needs Unix domain sockets, which are not available on this platform.')
+
+
+def serve(cpg: CircuitPlayground, path: str = None) -> None:
+    '''Serve cpg on the Unix socket path until interrupted with Ctrl-C.'''
+    _checkUnixSockets()
+    path = path or defaultSocketPath()
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path) # left over from a daemon which was killed
+        else:
+            raise Exception(f'ERROR in cpg_scpi: Another daemon is already serving on {path}.')
+        finally:
+            probe.close()
+    server = _Server(path, _Handler)
+    server.cpgDaemon = Daemon(cpg)
+    print(f'Serving {cpg.comPortObj.name} on {path}, press Ctrl-C to stop.')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.cpgDaemon.close()
+        os.remove(path)
+        print(f'{server.cpgDaemon.calls} calls, {server.cpgDaemon.coalesced} of them coalesced.')
+
+
+class CircuitPlaygroundClient:
+    '''Client of the daemon with the reader methods of CircuitPlayground.'''
+
+    def __init__(self, path: str = None) -> None:
+        self.path = path or defaultSocketPath()
+        _checkUnixSockets()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(self.path)
+        except OSError:
+            self._sock.close()
+            raise Exception(f'ERROR in cpg_scpi: No daemon on "{self.path}". Start it with "python -m cpg_scpi serve".')
+        self._buffer = b''
+        self._nextId = 0
+        self._streamBuffer = collections.deque()
+        self._streamError = None
+
+    def __enter__(self) -> 'CircuitPlaygroundClient':
+        return self
+
+    def __exit__(self, *excInfo) -> None:
+        self.close()
+
+    def close(self) -> None:
+        '''Close the connection to the daemon. A stream is stopped if no other client uses it.'''
+        self._sock.close()
+
+    def start_stream(self, cmd: str = 'MEAS:ACC?', interval_ms: int = 10) -> None:
+        '''Subscribe to a stream, see CircuitPlayground.start_stream(). All clients share the same stream.'''
+        self._call('start_stream', cmd, interval_ms)
+
+    def stop_stream(self) -> None:
+        '''Unsubscribe from the stream. The daemon stops it when the last client has unsubscribed.'''
+        self._call('stop_stream')
+
+    def read_stream(self, maxItems: int = None) -> List[tuple]:
+        '''Remove and return up to maxItems samples (all, if None) received so far.'''
+        while self._receive(0) is not None:
+            pass
+        if self._streamError is not None:
+            error, self._streamError = self._streamError, None
+            raise Exception(error)
+        n = len(self._streamBuffer) if maxItems is None else min(maxItems, len(self._streamBuffer))
+        return [self._streamBuffer.popleft() for i in range(n)]
+
+    def wait(self, seconds: float = 0) -> None:
+        time.sleep(seconds)
+
+    def _call(self, method: str, *args):
+        self._nextId += 1
+        requestId = self._nextId
+        self._sock.sendall((json.dumps({'id': requestId, 'method': method, 'args': list(args)}) + '\n').encode('utf-8'))
+        while True:
+            message = self._receive(None)
+            if message is None:
+                raise Exception('ERROR in cpg_scpi: The daemon closed the connection.')
+            if message.get('id') == requestId:
+                if 'error' in message:
+                    raise Exception(message['error'])
+                result = message['result']
+                if method == 'capSense_block':
+                    import numpy # (timestamps, values) like CircuitPlayground.capSense_block(), see _toJson()
+                    return numpy.array(result[0], dtype=numpy.float64), numpy.array(result[1], dtype=numpy.int16).reshape(-1, 8)
+                if method.endswith('_block'):
+                    import numpy
+                    return numpy.array(result, dtype=numpy.float64)
+                return _fromJson(result)
+
+    def _receive(self, timeout):
+        '''Return the next message which is not stream data, or None if nothing arrived within timeout seconds.
+        Stream data is stored for read_stream().'''
+        while True:
+            end = self._buffer.find(b'\n')
+            if end >= 0:
+                message = json.loads(self._buffer[:end])
+                self._buffer = self._buffer[end+1:]
+                if 'stream' not in message:
+                    return message
+                if 'error' in message:
+                    self._streamError = message['error']
+                else:
+                    self._streamBuffer.extend(tuple(sample) for sample in message['samples'])
+                continue
+            if timeout is not None and not select.select([self._sock], [], [], timeout)[0]:
+                return None
+            data = self._sock.recv(65536)
+            if not data:
+                return None
+            self._buffer += data
+
+
+def _clientMethod(name: str):
+    def method(self, *args):
+        return self._call(name, *args)
+    method.__name__ = name
+    method.__doc__ = getattr(CircuitPlayground, name).__doc__
+    return method
+
+for _name in QUERIES + COMMANDS:
+    setattr(CircuitPlaygroundClient, _name, _clientMethod(_name))
+
+
+def main(argv: List[str] = None) -> None:
+    '''Command line interface, see module docstring.'''
+    parser = argparse.ArgumentParser(prog='python -m cpg_scpi serve', description='Share one board between several local processes.')
+    parser.add_argument('--port', default='auto', help="com port, 'auto' (default) or 'virtual'")
+    parser.add_argument('--socket', default=None, help=f'path of the Unix socket (default {defaultSocketPath()})')
+    parser.add_argument('--query-policy', default='deferred', choices=CircuitPlayground.QUERY_POLICIES)
+    args = parser.parse_args(argv)
+    _checkUnixSockets() # before the board is opened
+    serve(CircuitPlayground(args.port, queryPolicy=args.query_policy), args.socket)
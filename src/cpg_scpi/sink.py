@@ -0,0 +1,223 @@
+'''File sinks for long captures
+
+FileSink takes samples from the acquisition loop or from a stream via a bounded queue and writes them to disk
+in a background thread, in batches. Acquisition timing therefore does not depend on disk or terminal latency.
+Supported formats are CSV, appendable NPY (readable with numpy.load(), numpy is not needed for writing) and
+the InfluxDB line protocol. Files can be rotated by size and/or age.
+
+Example:
+
+    from cpg_scpi.sink import FileSink
+
+    with FileSink('acc.csv', columns=('timestamp', 'x', 'y', 'z')) as sink:
+        for i in range(10000):
+            sink.put(cpg.acc_wts())
+        print(sink.stats())
+
+    # or let the stream reader thread feed the sink directly:
+    sink = FileSink('acc.npy', columns=('timestamp', 'x', 'y', 'z'), format='npy', rotateSeconds=3600)
+    cpg.start_stream('MEAS:ACC?', interval_ms=10, sink=sink)
+'''
+
+import array
+import math
+import numbers
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Iterable, Sequence
+
+FORMATS = ('csv', 'npy', 'line')
+
+
+class FileSink:
+    '''Writes samples (tuples of numbers) to files in a background thread.'''
+
+    def __init__(self, path: str, columns: Sequence[str], format: str = None, queueSize: int = 100000, batchSize: int = 1000,
+                 flushInterval: float = 1.0, overflow: str = 'drop', rotateBytes: int = None, rotateSeconds: float = None,
+                 measurement: str = 'cpg') -> None:
+        '''Create a sink and start its writer thread.
+        format is 'csv', 'npy' or 'line'. Default is derived from the file extension of path.
+        overflow='drop' drops samples if the queue is full, overflow='block' waits until there is space (backpressure).
+        If rotateBytes or rotateSeconds is set, a new file with a running number in its name is started after the given
+        size or age, e.g. acc-0000.csv, acc-0001.csv, ... Existing files are never overwritten, the numbering continues
+        after them.
+        measurement is the measurement name for the line protocol. NaN and infinite values are left out there.'''
+        self.path = path
+        self.columns = tuple(columns)
+        self.format = format or os.path.splitext(path)[1].lstrip('.').lower()
+        if self.format not in FORMATS:
+            raise Exception(f'ERROR in cpg_scpi: Unknown sink format "{self.format}". Use one of {FORMATS}.')
+        if overflow not in ('drop', 'block'):
+            raise Exception(f'ERROR in cpg_scpi: Unknown overflow policy "{overflow}". Use "drop" or "block".')
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self.overflow = overflow
+        self.rotateBytes = rotateBytes
+        self.rotateSeconds = rotateSeconds
+        self.measurement = measurement
+        self.written = 0
+        self.dropped = 0
+        self.backpressured = 0
+        self.files = []
+        self._fileNumber = 0
+        self._queue = queue.Queue(maxsize=queueSize)
+        self._file = None
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._writer, name='cpg_scpi-sink', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'FileSink':
+        return self
+
+    def __exit__(self, *excInfo) -> None:
+        self.close()
+
+    def put(self, sample: Sequence[float]) -> bool:
+        '''Queue a sample for writing. Return False if it was dropped because the queue was full.'''
+        if self._closed:
+            raise Exception('ERROR in cpg_scpi: The sink is closed.')
+        if self.format == 'line':
+            sample = (int(time.time() * 1e9), sample) # the line protocol needs the host time of each sample, time_ns() needs Python 3.7
+        try:
+            self._queue.put_nowait(sample)
+            return True
+        except queue.Full:
+            if self.overflow == 'drop':
+                self.dropped += 1
+                return False
+        self.backpressured += 1
+        self._queue.put(sample)
+        return True
+
+    def putMany(self, samples: Iterable[Sequence[float]]) -> int:
+        '''Queue several samples for writing. Return the number of samples which were not dropped.'''
+        return sum(self.put(sample) for sample in samples)
+
+    def stats(self) -> dict:
+        '''Return counters of written, dropped and backpressured samples, the queue fill level and the files written.'''
+        return {
+            'written': self.written,
+            'dropped': self.dropped,
+            'backpressured': self.backpressured,
+            'queued': self._queue.qsize(),
+            'files': list(self.files),
+        }
+
+    def close(self) -> None:
+        '''Write all queued samples, close the file and stop the writer thread.'''
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None) # tells the writer thread to stop, waits if the queue is full
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    # Writer thread:
+
+    def _writer(self) -> None:
+        try:
+            running = True
+            while running:
+                batch = []
+                try:
+                    batch.append(self._queue.get(timeout=self.flushInterval))
+                    while len(batch) < self.batchSize:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    pass
+                if batch and batch[-1] is None:
+                    batch.pop()
+                    running = False
+                if batch:
+                    self._write(batch)
+                elif self._file is not None:
+                    self._file.flush()
+                if self._file is not None and self._needsRotation():
+                    self._closeFile()
+        except Exception as e:
+            self._error = e
+            # Keep draining, such that put() with overflow='block' and close() do not hang:
+            while self._queue.get() is not None:
+                self.dropped += 1
+        finally:
+            if self._file is not None:
+                self._closeFile()
+
+    def _write(self, batch: list) -> None:
+        if self._file is None:
+            self._openFile()
+        if self.format == 'csv':
+            self._file.write(''.join(','.join(str(value) for value in sample) + '\n' for sample in batch).encode('utf-8'))
+        elif self.format == 'npy':
+            values = array.array('d', (float(value) for sample in batch for value in sample))
+            if sys.byteorder == 'big':
+                values.byteswap()
+            self._file.write(values.tobytes())
+            self._rows += len(batch)
+            self._writeNpyHeader()
+        else:
+            lines = []
+            for timestampNs, sample in batch:
+                fields = ','.join(f'{name}={text}' for name, text in zip(self.columns, map(_lineValue, sample)) if text is not None)
+                if fields: # a line needs at least one field
+                    lines.append(f'{self.measurement} {fields} {timestampNs}\n')
+            self._file.write(''.join(lines).encode('utf-8'))
+        self.written += len(batch)
+
+    def _needsRotation(self) -> bool:
+        if self.rotateBytes is not None and self._file.tell() >= self.rotateBytes:
+            return True
+        return self.rotateSeconds is not None and time.monotonic() - self._fileStartTime >= self.rotateSeconds
+
+    def _openFile(self) -> None:
+        path = self.path
+        if self.rotateBytes is not None or self.rotateSeconds is not None:
+            base, extension = os.path.splitext(self.path)
+            while True:
+                path = f'{base}-{self._fileNumber:04d}{extension}'
+                self._fileNumber += 1
+                try:
+                    self._file = open(path, 'xb') # files of earlier captures are kept
+                    break
+                except FileExistsError:
+                    pass
+        else:
+            self._file = open(path, 'wb')
+        self._fileStartTime = time.monotonic()
+        self.files.append(path)
+        if self.format == 'csv':
+            self._file.write((','.join(self.columns) + '\n').encode('utf-8'))
+        elif self.format == 'npy':
+            self._rows = 0
+            self._writeNpyHeader()
+
+    def _closeFile(self) -> None:
+        self._file.close()
+        self._file = None
+
+    _NPY_HEADER_SIZE = 128 # fixed size, such that the header can be rewritten with the current number of rows
+
+    def _writeNpyHeader(self) -> None:
+        '''Write or update the NPY header (format version 1.0) at the start of the file.'''
+        header = f"{{'descr': '<f8', 'fortran_order': False, 'shape': ({self._rows}, {len(self.columns)}), }}"
+        header = header.ljust(self._NPY_HEADER_SIZE - 10 - 1) + '\n'
+        position = self._file.tell()
+        self._file.seek(0)
+        self._file.write(b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header.encode('latin1'))
+        if position > 0:
+            self._file.seek(position)
+
+
+def _lineValue(value) -> str:
+    '''Format a field value for the line protocol. Return None for NaN and infinite values, which cannot be written.'''
+    if type(value).__name__ in ('bool', 'bool_'): # also numpy.bool_
+        return 'true' if value else 'false'
+    if isinstance(value, numbers.Integral):
+        return f'{int(value)}i'
+    value = float(value)
+    return repr(value) if math.isfinite(value) else None
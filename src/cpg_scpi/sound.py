@@ -0,0 +1,64 @@
+'''Analysis of microphone recordings
+
+Vectorized helpers (numpy) for blocks from CircuitPlayground.microphone_block() or streams of 'MEAS:SOUND?':
+
+    from cpg_scpi import sound
+
+    block = cpg.microphone_block(2000)                 # columns (timestamp, sound)
+    fs = sound.sampleRate(block[:, 0])
+    signal = sound.removeDc(block[:, 1])               # around the mean, or level=sound.SILENCE (approx. 330)
+    rms, db = sound.levels(signal, window=200)         # per window of 200 samples
+    frequencies, magnitudes = sound.spectrum(signal, fs)
+
+The microphone values are RAW values between 0 and 1023. Levels in dB are relative to the full scale amplitude
+of 512, i.e. 0 dB is the loudest undistorted sine wave.
+'''
+
+from typing import Tuple
+
+from . import _importNumpy
+
+SILENCE = 330 # approx. microphone value without sound
+FULL_SCALE = 512
+
+
+def sampleRate(timestamps) -> float:
+    '''Return the mean sample rate in Hz of a block from its timestamp column in seconds.'''
+    np = _importNumpy()
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    if len(timestamps) < 2 or timestamps[-1] <= timestamps[0]:
+        raise Exception('ERROR in cpg_scpi: At least two different timestamps are needed for the sample rate.')
+    return (len(timestamps) - 1) / (timestamps[-1] - timestamps[0])
+
+
+def removeDc(values, level: float = None):
+    '''Subtract the DC level from the microphone values and return them as float array.
+    level=None subtracts the mean of the values, otherwise the given level, e.g. SILENCE.'''
+    np = _importNumpy()
+    values = np.asarray(values, dtype=np.float64)
+    return values - (values.mean() if level is None else level)
+
+
+def levels(signal, window: int, reference: float = FULL_SCALE) -> Tuple[object, object]:
+    '''Return the RMS and the level in dB relative to reference per window of window samples of a DC free signal.
+    Samples after the last full window are ignored. Silence gives -inf dB.'''
+    np = _importNumpy()
+    signal = np.asarray(signal, dtype=np.float64)
+    if window < 1 or window > len(signal):
+        raise Exception(f'ERROR in cpg_scpi: window must be between 1 and the signal length {len(signal)}, not {window}.')
+    windows = len(signal) // window
+    rms = np.sqrt(np.mean(signal[:windows * window].reshape(windows, window) ** 2, axis=1))
+    with np.errstate(divide='ignore'):
+        db = 20 * np.log10(rms / reference)
+    return rms, db
+
+
+def spectrum(signal, sampleRate: float) -> Tuple[object, object]:
+    '''Return the frequencies in Hz and the amplitude spectrum of a DC free signal, with a Hann window.
+    The amplitudes are scaled such that a sine wave shows its amplitude at its frequency.'''
+    np = _importNumpy()
+    signal = np.asarray(signal, dtype=np.float64)
+    window = np.hanning(len(signal))
+    magnitudes = np.abs(np.fft.rfft(signal * window)) * 2 / window.sum()
+    frequencies = np.fft.rfftfreq(len(signal), 1 / sampleRate)
+    return frequencies, magnitudes
@@ -181,6 +181,19 @@ def testLightSpeed(cpg, iterations: int = 100) -> None:
     print(f'Total time: {result:.1f} seconds.')
     print(f'On average {(result*1000/iterations):.1f} ms per measurement.')
 
+def testQueryPolicySpeed(cpg, iterations: int = 100) -> None:
+    '''Compare acc and light measurement speed for all query policies.'''
+    originalPolicy = cpg.queryPolicy
+    try:
+        for policy in cpg.QUERY_POLICIES:
+            cpg.queryPolicy = policy
+            _printFuncTestHeadingWithDeliLine(f'Query policy "{policy}":')
+            testAccSpeed(cpg, iterations)
+            testLightSpeed(cpg, iterations)
+    finally:
+        cpg.queryPolicy = originalPolicy
+    _printFuncTestDeliLine()
+
 def _testResponseWaitTime(cpg, iterations: int = 10000) -> None:
     '''Test it the wait time for additional, unexpected responses is long enough.'''
     print(f'Testing Response-Wait-Time with {iterations} iterations ...')
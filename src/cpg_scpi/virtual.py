@@ -0,0 +1,341 @@
+'''Virtual Circuit Playground speaking SCPI
+
+VirtualDevice behaves like the serial port object of a Circuit Playground running the SCPI firmware.
+It implements the SCPI command set (see the overview in CircuitPlayground) including timestamps, RAW values
+and streaming, with a configurable response latency and jitter. Since CircuitPlayground talks to it through
+the same _query() and parsing code as to a real board, it can be used to test and benchmark applications
+without a board attached:
+
+    import cpg_scpi
+    cpg = cpg_scpi.CircuitPlayground('virtual')
+    # or with 2 ms latency and up to 1 ms jitter:
+    cpg = cpg_scpi.CircuitPlayground(cpg_scpi.virtual.VirtualDevice(latency=0.002, jitter=0.001))
+
+The emulated buttons and the slider switch can be set via the attributes buttonLeft, buttonRight and switch.
+unplug() emulates a lost USB connection, to test the reconnect of CircuitPlayground.
+'''
+
+import array
+import collections
+import math
+import pkgutil
+import random
+import sys
+import threading
+import time
+
+
+class _Receiver:
+    '''Receive side of the emulated transports with the read interface of serial.Serial. Responses are queued in
+    _pending with their due time and become readable in _rxBuffer at that time. Subclasses initialize _lock
+    (a threading.Condition), _rxBuffer, _pending and timeout.'''
+
+    def readline(self) -> bytes:
+        return self._read(lambda buffer: buffer.find(b'\n') + 1)
+
+    def read(self, size: int = 1) -> bytes:
+        return self._read(lambda buffer: size if len(buffer) >= size else 0, size)
+
+    @property
+    def in_waiting(self) -> int:
+        with self._lock:
+            self._checkPlugged()
+            self._collect(time.monotonic())
+            return len(self._rxBuffer)
+
+    def reset_input_buffer(self) -> None:
+        with self._lock:
+            self._checkPlugged()
+            self._collect(time.monotonic())
+            self._rxBuffer.clear()
+
+    def _read(self, available, size: int = None) -> bytes:
+        '''Wait until available(buffer) returns the number of bytes to be read, or until the timeout.'''
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._lock:
+            while True:
+                self._checkPlugged()
+                now = time.monotonic()
+                self._collect(now)
+                n = available(self._rxBuffer)
+                if n == 0 and deadline is not None and now >= deadline:
+                    n = len(self._rxBuffer) if size is None else min(size, len(self._rxBuffer)) # timeout: return what we have
+                if n > 0 or (deadline is not None and now >= deadline):
+                    data = bytes(self._rxBuffer[:n])
+                    del self._rxBuffer[:n]
+                    return data
+                wakeUp = self._nextDueTime()
+                if deadline is not None:
+                    wakeUp = deadline if wakeUp is None else min(wakeUp, deadline)
+                self._lock.wait(None if wakeUp is None else max(0.0, wakeUp - now))
+
+    def _checkPlugged(self) -> None:
+        pass
+
+    def _nextDueTime(self) -> float:
+        return self._pending[0][0] if self._pending else None
+
+    def _collect(self, now: float) -> None:
+        '''Move all responses which are due into the receive buffer.'''
+        while self._pending and self._pending[0][0] <= now:
+            self._rxBuffer += self._pending.popleft()[1]
+
+
+class VirtualDevice(_Receiver):
+    '''Emulated Circuit Playground with the interface of a serial.Serial object'''
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = None) -> None:
+        '''Create a virtual device. Each response is delayed by latency plus a random jitter between 0 and jitter seconds.'''
+        self.name = 'VIRTUAL'
+        self.baudrate = 115200
+        self.timeout = 5 # timeout is for reads
+        self.is_open = True
+        self.unplugged = False
+        self.latency = latency
+        self.jitter = jitter
+        self._rndGen_jitter = random.Random(seed)
+        self._startTime = time.monotonic()
+        self._lock = threading.Condition()
+        self._rxBuffer = bytearray()         # responses which are due, ready to be read
+        self._pending = collections.deque()  # responses which are not due yet: (dueTime, line)
+        self._stream = None                  # running repeated measurement: [cmd, remaining, nextDueTime]
+        self._inputLine = ''
+        self.reset()
+
+    def reset(self) -> None:
+        '''Reset configuration and sensor emulation like *RST.'''
+        self.timestamps = True
+        self.raw = False
+        self.interval_ms = 0
+        self.count = 1
+        self.capLimit = 50
+        self.ledColor = 0x0000ff
+        self.leds = 0
+        self.ledRed = False
+        self.buttonLeft = False
+        self.buttonRight = False
+        self.switch = False
+        self._rndGen_temp  = random.Random(2)
+        self._rndVal_temp  = 20.0
+        self._rndGen_light = random.Random(3)
+        self._rndVal_light = 100
+        self._rndGen_sound = random.Random(4)
+        self._accData = _loadAccData()
+        self._accDataIndex = 0
+        self._rndGen_touch = random.Random(3)
+        self._touchData = (0, 0, 1, 0, 0, 2, 0, 0, 4, 0, 0, 8, 0, 0, 16, 0, 0, 32, 0, 0, 64, 0, 0, 128, 0, 0)
+        self._touchDataIndex = 0
+
+    def unplug(self) -> None:
+        '''Emulate a lost USB connection: all further reads and writes raise OSError, like serial.SerialException.'''
+        with self._lock:
+            self.unplugged = True
+            self._lock.notify_all()
+
+    # Interface of serial.Serial:
+
+    def write(self, data: bytes) -> int:
+        with self._lock:
+            self._checkPlugged()
+            self._inputLine += data.decode('utf-8')
+            while '\n' in self._inputLine:
+                cmd, self._inputLine = self._inputLine.split('\n', 1)
+                cmd = cmd.strip()
+                if cmd:
+                    self._execute(cmd)
+            self._lock.notify_all()
+        return len(data)
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def _checkPlugged(self) -> None:
+        if self.unplugged:
+            raise OSError(5, 'Input/output error (virtual device unplugged)')
+
+    def _nextDueTime(self) -> float:
+        if self._pending:
+            return self._pending[0][0]
+        if self._stream is not None:
+            return self._stream[2]
+        return None
+
+    def _collect(self, now: float) -> None:
+        '''Move all responses which are due into the receive buffer, including the samples of a running stream.'''
+        super()._collect(now)
+        while self._stream is not None and self._stream[2] <= now:
+            cmd, remaining, dueTime = self._stream
+            self._rxBuffer += self._measure(cmd, dueTime)
+            remaining -= 1
+            if remaining == 0:
+                self._stream = None
+            else:
+                self._stream = [cmd, remaining, dueTime + max(self.interval_ms, 1) / 1000]
+
+    def _respond(self, *lines: str) -> None:
+        dueTime = time.monotonic() + self.latency + self.jitter * self._rndGen_jitter.random()
+        if self._pending:
+            dueTime = max(dueTime, self._pending[-1][0]) # keep the order of the responses
+        self._pending.append((dueTime, ''.join(line + '\r\n' for line in lines).encode('utf-8')))
+
+    # SCPI command interpreter:
+
+    def _execute(self, cmd: str) -> None:
+        name, _, arg = cmd.partition(' ')
+        name = name.upper()
+        try:
+            if name in self._measurements:
+                if self.count == 1:
+                    self._respond(self._measure(name, time.monotonic()).decode('utf-8').rstrip())
+                else:
+                    self._stream = [name, self.count, time.monotonic() + self.latency]
+            elif name == 'MEAS:STOP':
+                self._stream = None
+            elif name == '*IDN?':
+                self._respond('Virtual Circuit Playground', 'cpg_scpi.virtual.VirtualDevice', 'SCPI emulation', f'Latency {self.latency*1000:.1f} ms',
+                              f'Jitter {self.jitter*1000:.1f} ms', 'No hardware attached')
+            elif name == '*RST':
+                self._stream = None
+                self.reset()
+            elif name == 'SYST:CON?':
+                self._respond(f'TIMESTAMP {"MS" if self.timestamps else "OFF"}', f'MEAS:TINT {self.interval_ms}', f'MEAS:COUNT {self.count}',
+                              f'MEAS:TYPE {"RAW" if self.raw else "SI"}', f'MEAS:CAPLIM {self.capLimit}', f'LED:COL {self.ledColor}',
+                              f'LED {self.leds}', f'LED:RED {int(self.ledRed)}', f'UPTIME {self._uptimeMs(time.monotonic())}')
+            elif name == 'SYST:CON:TIMESTAMP':
+                self.timestamps = self._choice(arg, {'MS': True, 'OFF': False})
+            elif name == 'SYST:CON:MEAS:TINT':
+                self.interval_ms = max(0, int(arg))
+            elif name == 'SYST:CON:MEAS:COUNT':
+                self.count = int(arg)
+                if self.count == 0 or self.count < -1:
+                    raise ValueError(arg)
+            elif name == 'SYST:CON:MEAS:TYPE':
+                self.raw = self._choice(arg, {'RAW': True, 'SI': False})
+            elif name == 'SYST:CON:MEAS:CAPLIM':
+                self.capLimit = int(arg)
+            elif name == 'SYST:CON:LED:COL':
+                self.ledColor = int(arg, 0)
+            elif name == 'OUT:LED':
+                self.leds = int(arg) & 0x3ff
+            elif name == 'OUT:LED:RED':
+                self.ledRed = bool(int(arg))
+            elif name == 'OUT:DEMO:LED':
+                pass
+            else:
+                self._respond(f'ERROR: unknown command "{cmd}"')
+        except ValueError:
+            self._respond(f'ERROR: invalid parameter "{cmd}"')
+
+    @staticmethod
+    def _choice(arg: str, choices: dict):
+        if arg.upper() not in choices:
+            raise ValueError(arg)
+        return choices[arg.upper()]
+
+    def _uptimeMs(self, now: float) -> int:
+        return int((now - self._startTime) * 1000) % 2**32
+
+    def _measure(self, cmd: str, now: float) -> bytes:
+        '''Return a complete response line for the measurement cmd at time now.'''
+        values = self._measurements[cmd](self)
+        if self.timestamps:
+            values = (self._uptimeMs(now), *values)
+        return (' '.join(str(value) for value in values) + '\r\n').encode('utf-8')
+
+    # Sensor emulation:
+
+    def _measButtonAny(self) -> tuple:
+        return (int(self.buttonLeft or self.buttonRight),)
+
+    def _measButtonLeft(self) -> tuple:
+        return (int(self.buttonLeft),)
+
+    def _measButtonRight(self) -> tuple:
+        return (int(self.buttonRight),)
+
+    def _measSwitch(self) -> tuple:
+        return (int(self.switch),)
+
+    def _measTemp(self) -> tuple:
+        '''Emulate drifting temperature sensor.'''
+        value = self._rndVal_temp
+        self._rndVal_temp += 2.0 * (self._rndGen_temp.random() -0.5)
+        self._rndVal_temp = round(_clamp(10, self._rndVal_temp, 30), 2)
+        if self.raw:
+            # Inverse of the thermistor conversion in cpg_scpi._tempRawToSi():
+            resistance = 10000 * math.exp(3380 * (1 / (value + 273.15) - 1 / (25 + 273.15)))
+            return (round(1023 / (1 + 10000 / resistance)),)
+        return (f'{value:.2f}',)
+
+    def _measAcc(self) -> tuple:
+        '''Replay recorded accelerometer data.'''
+        values = self._accData[self._accDataIndex]
+        self._accDataIndex = (self._accDataIndex + 1) % len(self._accData) # ring-counter
+        if self.raw:
+            return tuple(round(value * 1000) for value in values) # mm/s^2
+        return tuple(f'{value:.2f}' for value in values)
+
+    def _measLight(self) -> tuple:
+        '''Emulate drifting light sensor.'''
+        value = self._rndVal_light
+        self._rndVal_light += int(80 * (self._rndGen_light.random() -0.5))
+        self._rndVal_light = int(_clamp(0, self._rndVal_light, 1023))
+        return (value,)
+
+    def _measSound(self) -> tuple:
+        '''Emulate a quiet room with approx. 330 corresponding to silence.'''
+        return (int(_clamp(0, round(self._rndGen_sound.gauss(330, 5)), 1023)),)
+
+    def _nextTouch(self) -> int:
+        '''Emulate touch sensors, return a single int value between 0 and 255 with one bit for each sensor.'''
+        # The first values come from stored data
+        if self._touchDataIndex < len(self._touchData):
+            self._touchDataIndex += 1
+            return self._touchData[self._touchDataIndex-1]
+        # Appox. 50% of all values should be 0, the rest between 1 and 255:
+        if self._rndGen_touch.randint(1, 10) <= 5:
+            return 0
+        return self._rndGen_touch.randint(1, 255)
+
+    def _measCapTap(self) -> tuple:
+        return (self._nextTouch(),)
+
+    def _measCapSense(self) -> tuple:
+        touched = self._nextTouch()
+        return tuple(self.capLimit + 150 if touched & (1 << i) else 0 for i in range(8))
+
+    def _measTime(self) -> tuple:
+        return ()
+
+    _measurements = {
+        'MEAS:BUTTON?'      : _measButtonAny,
+        'MEAS:BUTTON:LEFT?' : _measButtonLeft,
+        'MEAS:BUTTON:RIGHT?': _measButtonRight,
+        'MEAS:SWITCH?'      : _measSwitch,
+        'MEAS:TEMP?'        : _measTemp,
+        'MEAS:ACC?'         : _measAcc,
+        'MEAS:LIGHT?'       : _measLight,
+        'MEAS:SOUND?'       : _measSound,
+        'MEAS:CAP:SENSE?'   : _measCapSense,
+        'MEAS:CAP:TAP?'     : _measCapTap,
+        'MEAS:TIME?'        : _measTime,
+    }
+
+
+def _clamp(minVal, val, maxVal):
+    return max(min(maxVal, val), minVal)
+
+
+# Recorded accelerometer data (x, y, z) in m/s^2, loaded on first use and shared by all virtual devices.
+# Stored as little endian int16 values in 1/100 m/s^2 in the package resource data/acc-emu.bin.
+_accData = None
+
+def _loadAccData() -> tuple:
+    global _accData
+    if _accData is None:
+        values = array.array('h')
+        values.frombytes(pkgutil.get_data(__package__, 'data/acc-emu.bin'))
+        if sys.byteorder == 'big':
+            values.byteswap()
+        _accData = tuple((values[i] / 100, values[i+1] / 100, values[i+2] / 100) for i in range(0, len(values), 3))
+    return _accData
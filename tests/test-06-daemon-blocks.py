@@ -0,0 +1,59 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import numpy as np
+
+import cpg_scpi
+from cpg_scpi import server
+
+# Round trip of every block method through the daemon, compared with the direct call on a virtual CPG.
+
+path = os.path.join(tempfile.mkdtemp(), 'cpg_scpi-test.sock')
+cpg = cpg_scpi.CircuitPlayground('virtual', lazyConnect=True)
+reference = cpg_scpi.CircuitPlayground('virtual', lazyConnect=True)
+daemon = server._Server(path, server._Handler)
+daemon.cpgDaemon = server.Daemon(cpg)
+threading.Thread(target=daemon.serve_forever, daemon=True).start()
+
+with server.CircuitPlaygroundClient(path) as client:
+    for name in server.QUERIES:
+        if not name.endswith('_block'):
+            continue
+        result = getattr(client, name)(5, 1)
+        expected = getattr(reference, name)(5, 1)
+        if isinstance(expected, tuple):
+            assert isinstance(result, tuple) and len(result) == len(expected), name
+            for r, e in zip(result, expected):
+                assert r.shape == e.shape and r.dtype == e.dtype, name
+        else:
+            assert result.shape == expected.shape and result.dtype == expected.dtype, name
+        print(f'{name:20} OK')
+
+# Malformed requests are answered with an error and the connection stays usable:
+with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as raw:
+    raw.connect(path)
+    reader = raw.makefile('rb')
+    for request in (b'not json\n', b'[1, 2]\n', b'{"method": "idn"}\n', b'{"id": 7, "method": "light"}\n'):
+        raw.sendall(request)
+        response = json.loads(reader.readline())
+        print(request.strip().decode(), '->', response)
+    assert 'result' in response and response['id'] == 7
+    reader.close()
+
+# A second daemon must not take over the socket of a running one:
+try:
+    server.serve(reference, path)
+    raise AssertionError('serve() replaced a running daemon')
+except Exception as e:
+    assert 'already serving' in str(e), e
+    print(e)
+
+daemon.shutdown()
+daemon.server_close()
+daemon.cpgDaemon.close()
+os.remove(path)
+reference.close()
+print('Done.')
@@ -0,0 +1,41 @@
+import random
+
+import numpy as np
+
+from cpg_scpi.filters import MovingAverage, RollingRMS, EMA, LowPass, RollingMinMax, Chain
+
+# Filtering blocks in chunks of uneven sizes must give the same results as filtering sample by sample with update().
+
+def chunks(values, rndGen):
+    start = 0
+    while start < len(values):
+        size = rndGen.choice((1, 2, 3, 5, 17))
+        yield values[start:start+size]
+        start += size
+
+def check(makeFilter, values, rndGen):
+    scalar = makeFilter()
+    expected = np.array([scalar.update(tuple(row) if values.ndim == 2 else float(row)) for row in values])
+    block = makeFilter()
+    result = np.concatenate([block.update_block(chunk) for chunk in chunks(values, rndGen)])
+    error = np.max(np.abs(result - expected))
+    assert error < 1e-9, f'{makeFilter().__class__.__name__}: max. error {error}'
+    return error
+
+rndGen = random.Random(1)
+data = np.random.default_rng(1).normal(size=(500, 3))
+filters = {
+    'MovingAverage(3)': lambda: MovingAverage(3),
+    'RollingRMS(4)': lambda: RollingRMS(4),
+    'EMA(0.2)': lambda: EMA(0.2),
+    'LowPass(5, 100)': lambda: LowPass(5, 100),
+    'RollingMinMax(1)': lambda: RollingMinMax(1),
+    'RollingMinMax(3)': lambda: RollingMinMax(3),
+    'RollingMinMax(8)': lambda: RollingMinMax(8),
+    'Chain': lambda: Chain(MovingAverage(5), EMA(0.5)),
+}
+for name, makeFilter in filters.items():
+    for values in (data, data[:, 0]):
+        error = check(makeFilter, values, rndGen)
+    print(f'{name:20} OK (max. error {error:.1e})')
+print('Done.')
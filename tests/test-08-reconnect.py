@@ -0,0 +1,49 @@
+import time
+
+import cpg_scpi
+
+# A query and a running stream must survive a lost connection, emulated with VirtualDevice.unplug().
+
+cpg = cpg_scpi.CircuitPlayground('virtual', lazyConnect=True)
+cpg.setCapLimit(77)
+print(cpg.acc())
+
+cpg.comPortObj.unplug()
+x, y, z = cpg.acc() # reconnects and repeats the query
+assert cpg.reconnects == 1, cpg.reconnects
+assert cpg.comPortObj.capLimit == 77, 'the cap limit was not restored'
+print(f'query after unplug()   OK ({cpg.reconnects} reconnect)')
+
+samples = []
+cpg.start_stream('MEAS:ACC?', interval_ms=5, count=100)
+while len(samples) < 20:
+    time.sleep(0.01)
+    samples += cpg.read_stream()
+cpg.comPortObj.unplug()
+deadline = time.monotonic() + 10
+while cpg.is_streaming and time.monotonic() < deadline:
+    time.sleep(0.01)
+    samples += cpg.read_stream()
+samples += cpg.read_stream()
+assert not cpg.is_streaming, 'the stream did not end'
+assert cpg.reconnects == 2, cpg.reconnects
+assert len(samples) == 100, len(samples)
+assert all(len(sample) == 4 for sample in samples)
+print(f'stream after unplug()  OK ({len(samples)} samples, {cpg.reconnects} reconnects)')
+cpg.close()
+
+cpg = cpg_scpi.CircuitPlayground('virtual', lazyConnect=True, autoReconnect=False)
+cpg.comPortObj.unplug()
+try:
+    cpg.acc()
+    raise AssertionError('no CpgDisconnectedError without autoReconnect')
+except cpg_scpi.CpgDisconnectedError as e:
+    print(e)
+assert cpg.reconnects == 0
+cpg.reconnect()
+print(cpg.acc())
+assert cpg.reconnects == 1
+print('manual reconnect()     OK')
+cpg.close()
+
+print('Done.')
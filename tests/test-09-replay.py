@@ -0,0 +1,45 @@
+import os
+import tempfile
+
+import cpg_scpi
+from cpg_scpi.replay import ReplayDevice, readRecording
+
+# A session recorded on a virtual CPG must replay with the same values, and a different command must be detected.
+
+path = os.path.join(tempfile.mkdtemp(), 'session.cpgrec')
+
+def session(cpg):
+    return [cpg.acc(), cpg.temp_wts(), cpg.light(), cpg.capSense(), cpg.snapshot(['acc', 'touch']), cpg.acc_block(20, 1).tolist()]
+
+cpg = cpg_scpi.CircuitPlayground('virtual', lazyConnect=True)
+cpg.start_recording(path)
+recorded = session(cpg)
+cpg.stop_recording()
+try:
+    cpg.start_recording(path)
+    raise AssertionError('start_recording() overwrote an existing recording')
+except FileExistsError:
+    print('existing recording kept')
+cpg.close()
+
+records = list(readRecording(path))
+print(f'{len(records)} records')
+assert records and all(direction in (0, 1) for hostTime, direction, data in records)
+
+for speed in (None, 1.0):
+    replay = cpg_scpi.CircuitPlayground(ReplayDevice(path, speed), lazyConnect=True)
+    assert session(replay) == recorded, f'replay with speed {speed} differs'
+    replay.close()
+    print(f'replay with speed {speed} OK')
+
+replay = cpg_scpi.CircuitPlayground(ReplayDevice(path), lazyConnect=True)
+try:
+    replay.temp()
+    raise AssertionError('a different command was not detected')
+except Exception as e:
+    assert 'Replay differs from recording' in str(e), e
+    print(e)
+replay.close()
+
+os.remove(path)
+print('Done.')